@@ -0,0 +1,126 @@
+"""
+CSV helpers shared by the pipeline scripts.
+
+Reading: the raw exports are read with pyarrow's CSV reader into Arrow-backed
+columns. The header is probed first so only the columns a script uses are
+parsed; columns are matched by cleaned name (see clean_column_name).
+
+Writing: write_csv writes pipeline outputs with pyarrow's native CSV writer.
+Values read back the same as DataFrame.to_csv output; the one difference on
+disk is quoting: pyarrow quotes the header and every string value, where
+pandas only quotes fields that need it.
+"""
+
+import csv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pandas.api.types import infer_dtype, is_integer_dtype, is_string_dtype
+
+# Header cleaning: spaces become underscores (see clean_column_name)
+COLUMN_NAME_TABLE = str.maketrans({' ': '_'})
+
+# Default block size for iter_csv_arrow; bounds peak memory when streaming
+CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def clean_column_name(name):
+    """Standardize one column name: trimmed, lowercase, spaces to underscores."""
+    return name.strip().lower().translate(COLUMN_NAME_TABLE)
+
+
+def read_header(path):
+    """Return the raw header row of a CSV without reading the rest of it."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def select_columns(path, columns):
+    """
+    Return the raw header names of a CSV whose cleaned name is in `columns`.
+
+    If none match, the whole header is returned so callers can still report it.
+    """
+    header = read_header(path)
+    wanted = set(columns)
+    return [name for name in header if clean_column_name(name) in wanted] or header
+
+
+def read_csv_arrow(path, column_types=None, columns=None):
+    """
+    Read a CSV with pyarrow's multithreaded reader into Arrow-backed columns.
+
+    String ops then run in Arrow compute kernels instead of per-object Python
+    calls, and no object-dtype copies are made. Empty cells are read as nulls,
+    matching pd.read_csv.
+
+    If `columns` (cleaned names) is given, the header is probed first and only
+    the matching raw columns are converted; the rest are skipped by the parser.
+    """
+    include_columns = select_columns(path, columns) if columns is not None else []
+
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        parse_options=pacsv.ParseOptions(delimiter=','),
+        convert_options=pacsv.ConvertOptions(column_types=column_types or {},
+                                             include_columns=include_columns,
+                                             strings_can_be_null=True)
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def iter_csv_arrow(path, columns, block_size=CHUNK_BYTES):
+    """
+    Stream a CSV in blocks of roughly `block_size` bytes as pandas chunks.
+
+    All selected columns are read as strings, since pyarrow's streaming reader
+    fixes column types from the first block.
+    """
+    include_columns = select_columns(path, columns)
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=block_size),
+        parse_options=pacsv.ParseOptions(delimiter=','),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in include_columns},
+            include_columns=include_columns,
+            strings_can_be_null=True)
+    )
+    for batch in reader:
+        yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _writes_natively(col: pd.Series) -> bool:
+    """True if pyarrow writes this column's values exactly as pandas does."""
+    if is_integer_dtype(col.dtype):
+        return True
+    if is_string_dtype(col.dtype):
+        # Object columns only if they really hold strings
+        return col.dtype != object or infer_dtype(col, skipna=True) in ('string', 'empty')
+    return False
+
+
+def _csv_text(col: pd.Series) -> pd.Series:
+    """
+    Render a column as text the way DataFrame.to_csv does, keeping nulls.
+
+    Without this pyarrow writes booleans as true/false, 1.0 as 1, dates with
+    microseconds, and converts object columns of datetimes that mix UTC
+    offsets to a single zone.
+    """
+    return col.astype(str).where(col.notna())
+
+
+def write_csv(df: pd.DataFrame, path) -> None:
+    """Write a DataFrame to CSV with pyarrow's native writer, falling back to pandas."""
+    try:
+        text = pd.DataFrame({
+            name: col if _writes_natively(col) else _csv_text(col)
+            for name, col in df.items()
+        })
+        pacsv.write_csv(pa.Table.from_pandas(text, preserve_index=False), str(path))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g. object columns mixing types; pandas handles these
+        df.to_csv(path, index=False)
@@ -33,6 +33,7 @@ sys.path.append(str(Path(__file__).parent))
 from parsers.mbox_parser import MboxParser
 from parsers.csv_processor import MySQLCSVProcessor
 from classifiers.funnel_classifier import FunnelClassifier
+from csv_io import write_csv
 
 
 class SalesIntelligenceOrchestrator:
@@ -122,9 +123,10 @@ class SalesIntelligenceOrchestrator:
         output_dir = Path("data/processed")
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        contacts_df.to_csv(output_dir / "email_contacts.csv", index=False)
-        conversations_df.to_csv(output_dir / "email_conversations.csv", index=False)
-        signals_df.to_csv(output_dir / "email_signals.csv", index=False)
+        write_csv(contacts_df, output_dir / "email_contacts.csv")
+        write_csv(parser.contact_companies_df, output_dir / "email_contact_companies.csv")
+        write_csv(conversations_df, output_dir / "email_conversations.csv")
+        write_csv(signals_df, output_dir / "email_signals.csv")
 
         logger.info(f"✓ Parsed {len(contacts_df)} unique email contacts")
         logger.info(f"✓ Identified {len(conversations_df)} conversation threads")
@@ -11,21 +11,129 @@ Extracts:
 
 import mailbox
 import email
+import os
 import re
-from datetime import datetime
-from collections import defaultdict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
 from email.utils import parsedate_to_datetime, parseaddr
 import yaml
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
+
+# Add scripts directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from csv_io import write_csv
+
+try:
+    import re2 as _re2  # google-re2: linear-time DFA matcher
+except ImportError:
+    _re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile(pattern: str):
+    """
+    Compile with RE2 when available, falling back to Python's re.
+
+    RE2's \\b is ASCII-only, so re is compiled with re.ASCII to match it; the
+    patterns below spell out their whitespace and word classes for the same
+    reason. Both engines then extract the same text.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, re.ASCII)
+
+
+# Body cleanup patterns
+_WS_RE = re.compile(r'\s+')
+_SIG_RE = re.compile(r'--\s*\n.*', re.DOTALL)
+
+# ASCII \s and \w for use inside [...]
+_SPACE = r' \t\n\r\f\v'
+_WORD = r'A-Za-z0-9_'
+
+# Company mention patterns
+COMPANY_PATTERNS = [
+    _compile(rf'\b([A-Z][a-zA-Z0-9{_SPACE}&]+(?:Inc|LLC|Ltd|Corp|Corporation|Company|Technologies|Systems|Solutions|Services|Group))\b'),
+    _compile(rf'\bat[{_SPACE}]+([A-Z][a-zA-Z0-9{_SPACE}&]{{2,30}})\b'),
+    _compile(rf'\bfor[{_SPACE}]+([A-Z][a-zA-Z0-9{_SPACE}&]{{2,30}})\b'),
+]
+
+# Common role keywords
+ROLE_KEYWORDS = [
+    'engineer', 'developer', 'manager', 'director', 'analyst', 'designer',
+    'architect', 'lead', 'senior', 'junior', 'consultant', 'specialist',
+    'coordinator', 'administrator', 'officer', 'executive', 'VP', 'CTO',
+    'CEO', 'CFO', 'COO', 'head of', 'recruiter', 'HR'
+]
+
+# One case-insensitive pattern per role keyword (inline flag works in both engines)
+ROLE_PATTERNS = [
+    _compile(rf'(?i)\b((?:senior|junior|lead)?[{_SPACE}]*{keyword}(?:[{_SPACE}]+[{_WORD}]+){{0,3}})\b')
+    for keyword in ROLE_KEYWORDS
+]
+
+# Arrow-backed strings make the vectorized keyword scans run on contiguous buffers
+_STRING_DTYPE = 'string[pyarrow]'
+
+
+# Below this size the process pool costs more than it saves
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+def _find_message_offsets(mbox_path: str) -> List[int]:
+    """Return byte offsets of every 'From ' separator line in an mbox file."""
+    offsets = []
+    pos = 0
+
+    with open(mbox_path, 'rb') as f:
+        for line in f:
+            if line.startswith(b'From '):
+                offsets.append(pos)
+            pos += len(line)
+
+    return offsets
+
+
+def _parse_chunk(config_path: str, mbox_path: str, offsets: List[int], end: int):
+    """Parse the messages starting at `offsets` (up to byte `end`) in a worker process."""
+    parser = MboxParser(config_path)
+    bounds = offsets + [end]
+
+    with open(mbox_path, 'rb') as f:
+        f.seek(offsets[0])
+
+        # Messages are contiguous, so read them one at a time; only a single
+        # message is held in memory, as with mailbox.mbox
+        for i, start in enumerate(offsets):
+            data = f.read(bounds[i + 1] - start)
+            try:
+                # Drop the 'From ' separator line; the rest is a plain RFC 822 message
+                raw = data.split(b'\n', 1)[-1]
+                parser._process_message(email.message_from_bytes(raw))
+            except Exception as e:
+                logger.error(f"Error processing email at byte {start}: {e}")
+                continue
+
+    threads = (list(parser._thread_idx), parser._thread_participants, parser._thread_start,
+               parser._thread_end, parser._thread_signals, parser._thread_email_count)
+
+    return parser.emails, parser._contact_events, threads, parser._contact_companies
+
+
 class MboxParser:
     def __init__(self, config_path: str = "config/settings.yaml"):
         """Initialize parser with configuration."""
+        self.config_path = config_path
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
 
@@ -33,29 +141,42 @@ class MboxParser:
         self.middle_funnel_keywords = self.config['classification']['middle_funnel']['keywords']
         self.hidden_opp_keywords = self.config['classification']['hidden_opportunities']
 
+        # Signal type -> keywords, middle funnel signals first, then hidden opportunities
+        self.signal_keywords = {
+            'stalled': self.middle_funnel_keywords['stalled'],
+            'jd_shared': self.middle_funnel_keywords['jd_shared'],
+            'proposal_sent': self.middle_funnel_keywords['proposal_sent'],
+            'negotiation': self.middle_funnel_keywords['negotiation'],
+            'reconnect_later': self.middle_funnel_keywords['reconnect_later'],
+            'hidden_inbound': self.hidden_opp_keywords['inbound_signals'],
+            'hidden_referral': self.hidden_opp_keywords['referral_signals'],
+            'hidden_job_change': self.hidden_opp_keywords['job_change_signals'],
+            'hidden_keep_in_touch': self.hidden_opp_keywords['keep_in_touch'],
+        }
+
+        # Our own email domains (exact match, used for direction detection)
+        self._our_domains = frozenset(
+            d.lower() for d in self.config.get('our_domains', ['talentxo.com'])
+        )
+
         # Storage for parsed data
         self.emails = []
-        self.contacts = defaultdict(lambda: {
-            'name': '',
-            'email': '',
-            'companies': set(),
-            'roles': set(),
-            'first_contact': None,
-            'last_contact': None,
-            'total_emails': 0,
-            'inbound_count': 0,
-            'outbound_count': 0,
-        })
 
-        self.conversations = defaultdict(lambda: {
-            'thread_id': '',
-            'participants': set(),
-            'emails': [],
-            'start_date': None,
-            'last_date': None,
-            'status': 'unknown',
-            'signals': []
-        })
+        # Append-only contact log of (email, name, roles, date, is_inbound);
+        # aggregated once at DataFrame time
+        self._contact_events = []
+
+        # Conversation threads as parallel column arrays, indexed via _thread_idx
+        self._thread_idx = {}  # thread_id -> index, in first-seen order
+        self._thread_participants = []
+        self._thread_start = []
+        self._thread_end = []
+        self._thread_signals = []
+        self._thread_email_count = []
+
+        # (email, company) pairs in long format; aggregated once at DataFrame time
+        self._contact_companies = []
+        self.contact_companies_df = pd.DataFrame(columns=['email', 'company'])
 
     def parse_mbox(self, mbox_path: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
@@ -68,6 +189,27 @@ class MboxParser:
         """
         logger.info(f"Starting to parse mbox file: {mbox_path}")
 
+        workers = os.cpu_count() or 1
+        if workers > 1 and os.path.getsize(mbox_path) >= PARALLEL_MIN_BYTES:
+            self._parse_parallel(mbox_path, workers)
+        else:
+            self._parse_sequential(mbox_path)
+
+        logger.info(f"Completed parsing. Total emails: {len(self.emails)}")
+
+        # Classify all emails at once
+        self._classify_emails()
+
+        # Convert to DataFrames
+        self.contact_companies_df = self._create_contact_companies_dataframe()
+        contacts_df = self._create_contacts_dataframe()
+        conversations_df = self._create_conversations_dataframe()
+        signals_df = self._create_signals_dataframe()
+
+        return contacts_df, conversations_df, signals_df
+
+    def _parse_sequential(self, mbox_path: str):
+        """Parse every message in the current process."""
         mbox = mailbox.mbox(mbox_path)
 
         for idx, message in enumerate(mbox):
@@ -81,14 +223,47 @@ class MboxParser:
                 logger.error(f"Error processing email {idx}: {e}")
                 continue
 
-        logger.info(f"Completed parsing. Total emails: {len(self.emails)}")
+    def _parse_parallel(self, mbox_path: str, workers: int):
+        """Split the mbox into contiguous byte ranges and parse them in a process pool."""
+        offsets = _find_message_offsets(mbox_path)
+        if not offsets:
+            return
 
-        # Convert to DataFrames
-        contacts_df = self._create_contacts_dataframe()
-        conversations_df = self._create_conversations_dataframe()
-        signals_df = self._create_signals_dataframe()
+        file_size = os.path.getsize(mbox_path)
+        chunk_size = -(-len(offsets) // workers)
+        chunks = [offsets[i:i + chunk_size] for i in range(0, len(offsets), chunk_size)]
+        ends = [chunk[0] for chunk in chunks[1:]] + [file_size]
 
-        return contacts_df, conversations_df, signals_df
+        logger.info(f"Parsing {len(offsets)} emails in {len(chunks)} chunks across {workers} processes")
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_parse_chunk, self.config_path, mbox_path, chunk, end)
+                for chunk, end in zip(chunks, ends)
+            ]
+
+            # Merge in file order so first-seen values (names, thread order) match a sequential run
+            for future in futures:
+                self._merge_partial(*future.result())
+                logger.info(f"Processed {len(self.emails)} emails...")
+
+    def _merge_partial(self, emails: list, contact_events: list, threads: tuple,
+                       contact_companies: list):
+        """Merge state parsed by a worker process into this parser."""
+        self.emails.extend(emails)
+        self._contact_events.extend(contact_events)
+        self._contact_companies.extend(contact_companies)
+
+        thread_ids, participants, starts, ends, signals, email_counts = threads
+
+        for i, thread_id in enumerate(thread_ids):
+            idx = self._thread_index(thread_id)
+
+            self._thread_participants[idx].update(participants[i])
+            self._thread_signals[idx].extend(signals[i])
+            self._thread_email_count[idx] += email_counts[i]
+            self._update_thread_dates(idx, starts[i])
+            self._update_thread_dates(idx, ends[i])
 
     def _process_message(self, message):
         """Process individual email message."""
@@ -107,6 +282,10 @@ class MboxParser:
         except:
             email_date = None
 
+        # '-0000' (unknown zone) parses as naive; treat it as UTC so all dates compare
+        if email_date is not None and email_date.tzinfo is None:
+            email_date = email_date.replace(tzinfo=timezone.utc)
+
         # Extract body
         body = self._extract_body(message)
 
@@ -121,22 +300,24 @@ class MboxParser:
         direction = self._detect_direction(from_email, recipients)
 
         # Extract company and role mentions
-        companies = self._extract_companies(body + ' ' + subject)
-        roles = self._extract_roles(body + ' ' + subject)
+        text = body + ' ' + subject
+        companies = self._extract_companies(text)
+        roles = self._extract_roles(text)
 
-        # Update contact information
-        self._update_contact(from_name, from_email, companies, roles, email_date, direction == 'inbound')
+        # Update contact information; every event from this email shares one roles tuple
+        roles_tuple = tuple(roles)
+        is_inbound = direction == 'inbound'
+        self._update_contact(from_name, from_email, companies, roles_tuple, email_date, is_inbound)
 
         for name, email_addr in recipients:
-            self._update_contact(name, email_addr, companies, roles, email_date, direction == 'outbound')
+            self._update_contact(name, email_addr, companies, roles_tuple, email_date, not is_inbound)
 
-        # Classify funnel stage and extract signals
-        funnel_stage, signals = self._classify_email(subject, body)
+        thread_id = in_reply_to if in_reply_to else msg_id
 
         # Store email data
         email_data = {
             'msg_id': msg_id,
-            'thread_id': in_reply_to if in_reply_to else msg_id,
+            'thread_id': thread_id,
             'subject': subject,
             'from_name': from_name,
             'from_email': from_email,
@@ -146,14 +327,13 @@ class MboxParser:
             'direction': direction,
             'companies': list(companies),
             'roles': list(roles),
-            'funnel_stage': funnel_stage,
-            'signals': signals
+            'funnel_stage': 'unknown',  # Set by _classify_emails
+            'signals': []
         }
 
         self.emails.append(email_data)
 
         # Update conversation thread
-        thread_id = in_reply_to if in_reply_to else msg_id
         self._update_conversation(thread_id, email_data)
 
     def _extract_body(self, message) -> str:
@@ -183,11 +363,10 @@ class MboxParser:
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
+        # Remove email signatures first (needs the newlines, and shrinks the input)
+        text = _SIG_RE.sub('', text, count=1)
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove email signatures
-        text = re.sub(r'--\s*\n.*', '', text, flags=re.DOTALL)
-        return text.strip()
+        return _WS_RE.sub(' ', text).strip()
 
     def _extract_recipients(self, to_addr: str, cc_addr: str) -> List[Tuple[str, str]]:
         """Extract all recipients from To and Cc fields."""
@@ -207,29 +386,16 @@ class MboxParser:
 
     def _detect_direction(self, from_email: str, recipients: List[Tuple[str, str]]) -> str:
         """Detect if email is inbound or outbound."""
-        # Check if from our domain
-        our_domains = ['talentxo.com', 'your-company.com']  # Update with actual domains
+        from_domain = from_email.rpartition('@')[2] if '@' in from_email else ''
 
-        from_domain = from_email.split('@')[-1] if '@' in from_email else ''
-
-        if any(domain in from_domain for domain in our_domains):
-            return 'outbound'
-        else:
-            return 'inbound'
+        return 'outbound' if from_domain in self._our_domains else 'inbound'
 
     def _extract_companies(self, text: str) -> set:
         """Extract company names from text."""
         companies = set()
 
-        # Common patterns for company mentions
-        patterns = [
-            r'\b([A-Z][a-zA-Z0-9\s&]+(?:Inc|LLC|Ltd|Corp|Corporation|Company|Technologies|Systems|Solutions|Services|Group))\b',
-            r'\bat\s+([A-Z][a-zA-Z0-9\s&]{2,30})\b',
-            r'\bfor\s+([A-Z][a-zA-Z0-9\s&]{2,30})\b',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
+        for pattern in COMPANY_PATTERNS:
+            matches = pattern.findall(text)
             companies.update([m.strip() for m in matches if len(m.strip()) > 3])
 
         return companies
@@ -238,165 +404,178 @@ class MboxParser:
         """Extract job role/position mentions from text."""
         roles = set()
 
-        # Common role patterns
-        role_keywords = [
-            'engineer', 'developer', 'manager', 'director', 'analyst', 'designer',
-            'architect', 'lead', 'senior', 'junior', 'consultant', 'specialist',
-            'coordinator', 'administrator', 'officer', 'executive', 'VP', 'CTO',
-            'CEO', 'CFO', 'COO', 'head of', 'recruiter', 'HR'
-        ]
-
         # Match patterns like "looking for a [role]" or "hiring [role]"
-        for keyword in role_keywords:
-            pattern = rf'\b((?:senior|junior|lead)?\s*{keyword}(?:\s+\w+){{0,3}})\b'
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in ROLE_PATTERNS:
+            matches = pattern.findall(text)
             roles.update([m.strip() for m in matches])
 
         return roles
 
     def _update_contact(self, name: str, email: str, companies: set,
-                       roles: set, date: datetime, is_inbound: bool):
-        """Update contact information in the contacts dictionary."""
+                       roles: tuple, date: datetime, is_inbound: bool):
+        """Record a contact event; events are aggregated per contact at DataFrame time."""
         if not email:
             return
 
-        contact = self.contacts[email]
-
-        if name and not contact['name']:
-            contact['name'] = name
-
-        contact['email'] = email
-        contact['companies'].update(companies)
-        contact['roles'].update(roles)
-        contact['total_emails'] += 1
-
-        if is_inbound:
-            contact['inbound_count'] += 1
-        else:
-            contact['outbound_count'] += 1
-
-        # Update dates
-        if date:
-            if not contact['first_contact'] or date < contact['first_contact']:
-                contact['first_contact'] = date
-            if not contact['last_contact'] or date > contact['last_contact']:
-                contact['last_contact'] = date
+        self._contact_events.append((email, name, roles, date, is_inbound))
+        self._contact_companies.extend((email, company) for company in companies)
 
-    def _classify_email(self, subject: str, body: str) -> Tuple[str, List[str]]:
+    def _classify_emails(self):
         """
-        Classify email into funnel stage and extract signals.
+        Classify all parsed emails into funnel stages and extract signals.
 
-        Returns:
-            funnel_stage: 'bottom', 'middle', 'top', 'hidden_opportunity'
-            signals: List of specific signals detected
+        Runs one vectorized keyword scan per signal type over every email,
+        then sets each email's funnel_stage ('middle', 'hidden_opportunity'
+        or 'unknown') and signals, and aggregates signals per conversation.
         """
-        text = (subject + ' ' + body).lower()
-        signals = []
-
-        # Check for middle funnel signals
-        middle_signals = {
-            'stalled': self.middle_funnel_keywords['stalled'],
-            'jd_shared': self.middle_funnel_keywords['jd_shared'],
-            'proposal_sent': self.middle_funnel_keywords['proposal_sent'],
-            'negotiation': self.middle_funnel_keywords['negotiation'],
-            'reconnect_later': self.middle_funnel_keywords['reconnect_later']
-        }
+        if not self.emails:
+            return
 
-        for signal_type, keywords in middle_signals.items():
-            if any(keyword in text for keyword in keywords):
-                signals.append(signal_type)
+        texts = pd.Series(
+            [(e['subject'] + ' ' + e['body']).lower() for e in self.emails],
+            dtype=_STRING_DTYPE
+        )
 
-        # Check for hidden opportunity signals
-        hidden_signals = {
-            'inbound': self.hidden_opp_keywords['inbound_signals'],
-            'referral': self.hidden_opp_keywords['referral_signals'],
-            'job_change': self.hidden_opp_keywords['job_change_signals'],
-            'keep_in_touch': self.hidden_opp_keywords['keep_in_touch']
-        }
+        masks = pd.DataFrame({
+            signal_type: self._contains_any(texts, keywords)
+            for signal_type, keywords in self.signal_keywords.items()
+        })
 
-        for signal_type, keywords in hidden_signals.items():
-            if any(keyword in text for keyword in keywords):
-                signals.append(f'hidden_{signal_type}')
+        hidden_cols = [c for c in masks.columns if c.startswith('hidden_')]
+        middle_cols = [c for c in masks.columns if not c.startswith('hidden_')]
 
         # Determine funnel stage
-        if any('hidden_' in s for s in signals):
-            funnel_stage = 'hidden_opportunity'
-        elif signals:
-            funnel_stage = 'middle'
-        else:
-            funnel_stage = 'unknown'
+        stages = np.select(
+            [masks[hidden_cols].any(axis=1), masks[middle_cols].any(axis=1)],
+            ['hidden_opportunity', 'middle'],
+            default='unknown'
+        )
+
+        signal_names = masks.columns.to_numpy()
+
+        for email_data, stage, row in zip(self.emails, stages, masks.to_numpy()):
+            signals = signal_names[row].tolist()
+            email_data['funnel_stage'] = str(stage)
+            email_data['signals'] = signals
+            self._thread_signals[self._thread_idx[email_data['thread_id']]].extend(signals)
+
+    @staticmethod
+    def _contains_any(texts: pd.Series, keywords: List[str]) -> pd.Series:
+        """Boolean mask of texts containing any of the keywords."""
+        if not keywords:
+            return pd.Series(False, index=texts.index)
+
+        pattern = '|'.join(map(re.escape, keywords))
+        return texts.str.contains(pattern, regex=True, na=False).astype(bool)
+
+    def _thread_index(self, thread_id: str) -> int:
+        """Return the column index of a conversation thread, creating it if new."""
+        idx = self._thread_idx.get(thread_id)
+
+        if idx is None:
+            idx = len(self._thread_idx)
+            self._thread_idx[thread_id] = idx
+            self._thread_participants.append(set())
+            self._thread_start.append(None)
+            self._thread_end.append(None)
+            self._thread_signals.append([])
+            self._thread_email_count.append(0)
+
+        return idx
+
+    def _update_thread_dates(self, idx: int, date: Optional[datetime]):
+        """Widen a thread's start/end dates to include date."""
+        if not date:
+            return
 
-        return funnel_stage, signals
+        if not self._thread_start[idx] or date < self._thread_start[idx]:
+            self._thread_start[idx] = date
+        if not self._thread_end[idx] or date > self._thread_end[idx]:
+            self._thread_end[idx] = date
 
     def _update_conversation(self, thread_id: str, email_data: dict):
         """Update conversation thread information."""
-        conv = self.conversations[thread_id]
+        idx = self._thread_index(thread_id)
 
-        conv['thread_id'] = thread_id
-        conv['emails'].append(email_data['msg_id'])
-        conv['participants'].add(email_data['from_email'])
+        participants = self._thread_participants[idx]
+        participants.add(email_data['from_email'])
 
         for _, recipient_email in email_data['recipients']:
-            conv['participants'].add(recipient_email)
+            participants.add(recipient_email)
 
-        # Update dates
-        if email_data['date']:
-            if not conv['start_date'] or email_data['date'] < conv['start_date']:
-                conv['start_date'] = email_data['date']
-            if not conv['last_date'] or email_data['date'] > conv['last_date']:
-                conv['last_date'] = email_data['date']
+        self._thread_email_count[idx] += 1
+        self._update_thread_dates(idx, email_data['date'])
 
-        # Aggregate signals
-        conv['signals'].extend(email_data['signals'])
+    def _create_contact_companies_dataframe(self) -> pd.DataFrame:
+        """Create long (email, company) DataFrame with a categorical company column."""
+        cc = pd.DataFrame(self._contact_companies, columns=['email', 'company'])
+        cc = cc.drop_duplicates(ignore_index=True)
+        cc['company'] = cc['company'].astype('category')
+        return cc
 
     def _create_contacts_dataframe(self) -> pd.DataFrame:
-        """Create DataFrame from contacts dictionary."""
-        contacts_list = []
-
-        for email, data in self.contacts.items():
-            contacts_list.append({
-                'email': email,
-                'name': data['name'],
-                'companies': ', '.join(data['companies']),
-                'roles': ', '.join(data['roles']),
-                'first_contact': data['first_contact'],
-                'last_contact': data['last_contact'],
-                'total_emails': data['total_emails'],
-                'inbound_count': data['inbound_count'],
-                'outbound_count': data['outbound_count'],
-                'engagement_ratio': data['inbound_count'] / max(data['total_emails'], 1)
-            })
-
-        return pd.DataFrame(contacts_list)
+        """Create DataFrame of unique contacts by aggregating the contact event log."""
+        columns = ['email', 'name', 'companies', 'roles', 'first_contact', 'last_contact',
+                   'total_emails', 'inbound_count', 'outbound_count', 'engagement_ratio']
+
+        events = pd.DataFrame(
+            self._contact_events,
+            columns=['email', 'name', 'roles', 'date', 'is_inbound']
+        )
+        if events.empty:
+            return pd.DataFrame(columns=columns)
+
+        grouped = events.groupby('email', sort=False)
+        contacts = pd.DataFrame({'total_emails': grouped.size()})
+        contacts['inbound_count'] = grouped['is_inbound'].sum()
+        contacts['outbound_count'] = contacts['total_emails'] - contacts['inbound_count']
+        contacts['engagement_ratio'] = contacts['inbound_count'] / contacts['total_emails']
+
+        # First non-empty name seen for each contact
+        names = events['name'].where(events['name'] != '')
+        contacts['name'] = names.groupby(events['email'], sort=False).first()
+
+        # Join each contact's companies and roles from the long tables
+        # Join as str: aggregating the categorical column would keep the category dtype,
+        # which then rejects the fillna('') below
+        cc = self.contact_companies_df
+        contacts['companies'] = cc['company'].astype(str).groupby(cc['email'], sort=False).agg(', '.join)
+        roles = events[['email', 'roles']].explode('roles').dropna().drop_duplicates()
+        contacts['roles'] = roles.groupby('email', sort=False)['roles'].agg(', '.join)
+
+        # Dates may mix UTC offsets (object dtype), so aggregate only the dated events
+        dates = events.dropna(subset=['date']).groupby('email', sort=False)['date'].agg(['min', 'max'])
+        contacts['first_contact'] = dates['min']
+        contacts['last_contact'] = dates['max']
+
+        contacts[['name', 'companies', 'roles']] = contacts[['name', 'companies', 'roles']].fillna('')
+
+        return contacts.rename_axis('email').reset_index()[columns]
 
     def _create_conversations_dataframe(self) -> pd.DataFrame:
-        """Create DataFrame from conversations dictionary."""
-        conv_list = []
-
-        for thread_id, data in self.conversations.items():
-            # Determine conversation status
-            signals = data['signals']
-            if 'stalled' in signals or 'reconnect_later' in signals:
-                status = 'stalled'
-            elif 'jd_shared' in signals or 'proposal_sent' in signals:
-                status = 'active_but_not_closed'
-            elif any('hidden_' in s for s in signals):
-                status = 'hidden_opportunity'
-            else:
-                status = 'unknown'
-
-            conv_list.append({
-                'thread_id': thread_id,
-                'participants': ', '.join(data['participants']),
-                'participant_count': len(data['participants']),
-                'email_count': len(data['emails']),
-                'start_date': data['start_date'],
-                'last_date': data['last_date'],
-                'status': status,
-                'signals': ', '.join(set(signals))
-            })
-
-        return pd.DataFrame(conv_list)
+        """Create DataFrame from the conversation thread columns."""
+        return pd.DataFrame({
+            'thread_id': list(self._thread_idx),
+            'participants': [', '.join(p) for p in self._thread_participants],
+            'participant_count': [len(p) for p in self._thread_participants],
+            'email_count': self._thread_email_count,
+            'start_date': self._thread_start,
+            'last_date': self._thread_end,
+            'status': [self._conversation_status(s) for s in self._thread_signals],
+            'signals': [', '.join(set(s)) for s in self._thread_signals]
+        })
+
+    @staticmethod
+    def _conversation_status(signals: List[str]) -> str:
+        """Determine conversation status from its aggregated signals."""
+        if 'stalled' in signals or 'reconnect_later' in signals:
+            return 'stalled'
+        elif 'jd_shared' in signals or 'proposal_sent' in signals:
+            return 'active_but_not_closed'
+        elif any('hidden_' in s for s in signals):
+            return 'hidden_opportunity'
+        else:
+            return 'unknown'
 
     def _create_signals_dataframe(self) -> pd.DataFrame:
         """Create DataFrame of all detected signals."""
@@ -428,9 +607,10 @@ def main():
     output_dir = Path("data/processed")
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    contacts_df.to_csv(output_dir / "email_contacts.csv", index=False)
-    conversations_df.to_csv(output_dir / "email_conversations.csv", index=False)
-    signals_df.to_csv(output_dir / "email_signals.csv", index=False)
+    write_csv(contacts_df, output_dir / "email_contacts.csv")
+    write_csv(parser.contact_companies_df, output_dir / "email_contact_companies.csv")
+    write_csv(conversations_df, output_dir / "email_conversations.csv")
+    write_csv(signals_df, output_dir / "email_signals.csv")
 
     logger.info(f"Saved {len(contacts_df)} contacts")
     logger.info(f"Saved {len(conversations_df)} conversations")
@@ -12,6 +12,10 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+import pyarrow as pa
+
+from csv_io import clean_column_name, read_csv_arrow, read_header, write_csv
+
 
 def process_txo_clientele():
     """Process Txo Clientele with verified status and repeat engagements."""
@@ -117,11 +121,12 @@ def link_roles_to_companies(companies_df, roles_df, clientele_df):
     print(f"  Linked {enhanced_companies['total_positions_filled'].sum()} positions to companies")
     print(f"  Average positions per client: {enhanced_companies['total_positions_filled'].mean():.1f}")
 
-    # Calculate days since last engagement
-    today = pd.Timestamp.now()
-    enhanced_companies['days_since_last_contact'] = (
-        today - enhanced_companies['last_engagement_date']
-    ).dt.days
+    # Calculate days since last engagement (calendar days, NaN if never engaged)
+    last = enhanced_companies['last_engagement_date'].to_numpy(dtype='datetime64[D]')
+    today = np.datetime64('today', 'D')
+    enhanced_companies['days_since_last_contact'] = np.where(
+        np.isnat(last), np.nan, (today - last).astype('int64')
+    )
 
     # Classify client status
     enhanced_companies['client_status'] = enhanced_companies.apply(
@@ -130,7 +135,7 @@ def link_roles_to_companies(companies_df, roles_df, clientele_df):
 
     # Estimate revenue (assuming $10k per placement as baseline)
     enhanced_companies['revenue_generated'] = (
-        enhanced_companies['total_positions_filled'] * 10000.0
+        enhanced_companies['total_positions_filled'].to_numpy() * 10000.0
     )
 
     return enhanced_companies, roles_df
@@ -152,6 +157,26 @@ def classify_client_status(row):
         return 'dormant_cold'
 
 
+def read_normalized_csv(path, header_map):
+    """
+    Read only the columns named in header_map, renamed in a single pass.
+
+    header_map maps cleaned headers (see clean_column_name) to output column
+    names. All columns are read as strings.
+    Raises KeyError if any are missing.
+    """
+    # Probe the header row, then let the pyarrow reader parse only what we need
+    rename = {col: header_map[clean_column_name(col)]
+              for col in read_header(path) if clean_column_name(col) in header_map}
+
+    missing = set(header_map.values()) - set(rename.values())
+    if missing:
+        raise KeyError(f"missing columns {sorted(missing)}")
+
+    df = read_csv_arrow(path, {col: pa.string() for col in rename}, list(header_map))
+    return df.rename(columns=rename)
+
+
 def process_sales_tracker_spocs():
     """Extract SPOCs from Sales Tracker files."""
     print("\nProcessing Sales Tracker SPOCs...")
@@ -160,12 +185,12 @@ def process_sales_tracker_spocs():
 
     # From Clients Master
     try:
-        master_df = pd.read_csv("data/raw/Sales Tracker - Clients - Master.csv")
-        master_df.columns = master_df.columns.str.strip().str.lower().str.replace(' ', '_')
-
-        spocs = master_df[['company_name', 'contact_name', 'department',
-                          'contact_email', 'contact_number', 'date']].copy()
-        spocs = spocs.dropna(subset=['contact_email'])
+        spocs = read_normalized_csv("data/raw/Sales Tracker - Clients - Master.csv", {
+            'company_name': 'company_name', 'contact_name': 'contact_name',
+            'department': 'department', 'contact_email': 'contact_email',
+            'contact_number': 'contact_number', 'date': 'date'
+        })
+        spocs = spocs[spocs['contact_email'].notna()]
         all_spocs.append(spocs)
         print(f"  Extracted {len(spocs)} SPOCs from Clients Master")
     except Exception as e:
@@ -173,13 +198,13 @@ def process_sales_tracker_spocs():
 
     # From Client POC
     try:
-        poc_df = pd.read_csv("data/raw/Sales Tracker - Client POC.csv")
-        poc_df.columns = poc_df.columns.str.strip().str.lower().str.replace(' ', '_')
-
-        spocs = poc_df[['company_name', 'contact_name', 'contact_email', 'date']].copy()
+        spocs = read_normalized_csv("data/raw/Sales Tracker - Client POC.csv", {
+            'company_name': 'company_name', 'contact_name': 'contact_name',
+            'contact_email': 'contact_email', 'date': 'date'
+        })
         spocs['department'] = None
         spocs['contact_number'] = None
-        spocs = spocs.dropna(subset=['contact_email'])
+        spocs = spocs[spocs['contact_email'].notna()]
         all_spocs.append(spocs)
         print(f"  Extracted {len(spocs)} SPOCs from Client POC")
     except Exception as e:
@@ -187,14 +212,13 @@ def process_sales_tracker_spocs():
 
     # From New Leads
     try:
-        leads_df = pd.read_csv("data/raw/Sales Tracker - New Leads.csv")
-        leads_df.columns = leads_df.columns.str.strip().str.lower().str.replace(' ', '_')
-
-        spocs = leads_df[['company_name', 'name', 'contact_email',
-                         'contact_number', 'linkedin_url', 'date']].copy()
-        spocs = spocs.rename(columns={'name': 'contact_name'})
+        spocs = read_normalized_csv("data/raw/Sales Tracker - New Leads.csv", {
+            'company_name': 'company_name', 'name': 'contact_name',
+            'contact_email': 'contact_email', 'contact_number': 'contact_number',
+            'linkedin_url': 'linkedin_url', 'date': 'date'
+        })
         spocs['department'] = None
-        spocs = spocs.dropna(subset=['contact_email'])
+        spocs = spocs[spocs['contact_email'].notna()]
         all_spocs.append(spocs)
         print(f"  Extracted {len(spocs)} SPOCs from New Leads")
     except Exception as e:
@@ -241,6 +265,9 @@ def create_final_outputs(enhanced_companies, roles_df, spocs_df):
     # Handle missing mappings
     spocs_df['client_id'] = spocs_df['client_id'].fillna(0).astype(int)
 
+    # Parse contact dates once; cache=True dedupes repeated date strings
+    contact_dates = pd.to_datetime(spocs_df['date'], format='%d/%m/%Y', errors='coerce', cache=True)
+
     spocs = pd.DataFrame({
         'spoc_id': range(1, len(spocs_df) + 1),
         'client_id': spocs_df['client_id'],
@@ -249,8 +276,8 @@ def create_final_outputs(enhanced_companies, roles_df, spocs_df):
         'phone': spocs_df['contact_number'].fillna(''),
         'job_title': spocs_df['department'].fillna(''),
         'linkedin_url': spocs_df.get('linkedin_url', '').fillna(''),
-        'first_contact_date': pd.to_datetime(spocs_df['date'], format='%d/%m/%Y', errors='coerce'),
-        'last_contact_date': pd.to_datetime(spocs_df['date'], format='%d/%m/%Y', errors='coerce'),
+        'first_contact_date': contact_dates,
+        'last_contact_date': contact_dates,
         'is_active': 1
     })
 
@@ -298,13 +325,13 @@ def main():
     # 6. Save to files
     output_dir = Path("data/raw")
 
-    clients.to_csv(output_dir / "clients.csv", index=False)
+    write_csv(clients, output_dir / "clients.csv")
     print(f"\n✅ Saved {len(clients)} clients to clients.csv")
 
-    spocs.to_csv(output_dir / "spocs.csv", index=False)
+    write_csv(spocs, output_dir / "spocs.csv")
     print(f"✅ Saved {len(spocs)} SPOCs to spocs.csv")
 
-    roles.to_csv(output_dir / "roles.csv", index=False)
+    write_csv(roles, output_dir / "roles.csv")
     print(f"✅ Saved {len(roles)} roles to roles.csv")
 
     # Print summary
@@ -2,46 +2,139 @@
 Preprocess Sales Tracker CSV files into standard format.
 
 Reads your custom Sales Tracker CSVs and creates:
-- clients.csv (standardized)
-- spocs.csv (standardized)
+- clients.csv (standardized, plus a clients.parquet twin)
+- spocs.csv (standardized, plus a spocs.parquet twin)
 """
 
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import numpy as np
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
+
+from csv_io import clean_column_name, iter_csv_arrow, read_csv_arrow
+
+# Raw Sales Tracker exports, keyed by SPOC source name
+RAW_FILES = {
+    'clients_master': "data/raw/Sales Tracker - Clients - Master.csv",
+    'client_poc': "data/raw/Sales Tracker - Client POC.csv",
+    'new_leads': "data/raw/Sales Tracker - New Leads.csv",
+    'txo_clientele': "data/raw/Strategy_Sourcing_Sales - Txo Clientele.csv",
+}
+
+# SPOC source labels, in precedence order for the email dedupe
+SPOC_SOURCES = list(RAW_FILES)
+
+# Dtype of the raw text columns (see read_csv_arrow)
+TEXT_DTYPE = pd.ArrowDtype(pa.string())
+
+# Columns each source actually uses, by cleaned name (see clean_column_names)
+RAW_COLUMNS = {
+    'clients_master': ['company_name', 'contact_name', 'department',
+                       'contact_email', 'contact_number', 'date'],
+    'client_poc': ['company_name', 'contact_name', 'contact_email', 'date'],
+    'new_leads': ['company_name', 'name', 'contact_email',
+                  'contact_number', 'linkedin_url', 'date'],
+    # Txo exports name the company column either way
+    'txo_clientele': ['company_name', 'company'],
+}
+
+
+def dedupe_by_email(frames, seen_emails):
+    """
+    Yield each frame with contact_email lowercased and stripped, keeping only
+    rows whose email is present and not already in `seen_emails` or earlier in
+    the same frame. `seen_emails` is updated as frames are consumed.
+    """
+    for frame in frames:
+        if not frame['contact_email'].notna().any():
+            continue
+        emails = frame['contact_email'].str.lower().str.strip()
+        keep = emails.notna() & ~emails.duplicated() & ~emails.isin(seen_emails)
+        frame = frame.loc[keep].copy()
+        frame['contact_email'] = emails[keep]
+        seen_emails.update(frame['contact_email'])
+        yield frame
+
+
+def load_raw_files():
+    """
+    Read all raw Sales Tracker CSVs concurrently.
+
+    Returns a dict keyed like RAW_FILES. Clients Master is required and any
+    error reading it is raised; the other files are optional and load as None
+    when missing or unreadable.
+
+    Clients Master is read whole since every row feeds clients.csv. The other
+    sources are streamed, and contact sources are deduped by email block by
+    block, so only their unique contacts are ever held in memory.
+    """
+    def read(name):
+        path = RAW_FILES[name]
+        if name == 'clients_master':
+            # Keep the date as a string so the explicit '%d/%m/%Y' parse applies,
+            # and phone numbers as text: a numeric column with blanks would
+            # otherwise come through as ints that the Parquet write rejects
+            return read_csv_arrow(path, {'Date': pa.string(), 'Contact Number': pa.string()},
+                                  RAW_COLUMNS[name])
+        if not Path(path).exists():
+            print(f"{path} not found, skipping")
+            return None
+        try:
+            chunks = (clean_column_names(chunk)
+                      for chunk in iter_csv_arrow(path, RAW_COLUMNS[name]))
+            if 'contact_email' in RAW_COLUMNS[name]:
+                chunks = dedupe_by_email(chunks, set())
+            chunks = list(chunks)
+            return pd.concat(chunks, ignore_index=True) if chunks else None
+        except (KeyError, ValueError) as e:
+            # ValueError covers parse/decode errors (pyarrow's ArrowInvalid is
+            # one); KeyError a missing contact_email column
+            print(f"Could not load {path}: {e}")
+            return None
+
+    # IO-bound and independent; pyarrow's reader releases the GIL
+    with ThreadPoolExecutor(max_workers=len(RAW_FILES)) as executor:
+        return dict(zip(RAW_FILES, executor.map(read, RAW_FILES)))
 
 
 def clean_column_names(df):
     """Standardize column names."""
-    # Remove extra whitespace and convert to lowercase
-    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    # One pass over the (short) header instead of three Index string ops
+    df.columns = [clean_column_name(c) for c in df.columns]
     return df
 
 
-def preprocess_clients_master():
+def source_column(source, n):
+    """Return a categorical 'source' column of length n (int8 codes, shared categories)."""
+    codes = np.full(n, SPOC_SOURCES.index(source), dtype=np.int8)
+    return pd.Categorical.from_codes(codes, categories=SPOC_SOURCES)
+
+
+def preprocess_clients_master(df):
     """Process 'Sales Tracker - Clients - Master.csv'"""
     print("Processing Clients Master...")
 
-    df = pd.read_csv("data/raw/Sales Tracker - Clients - Master.csv")
     df = clean_column_names(df)
 
     print(f"Found {len(df)} records in Clients Master")
     print(f"Columns: {list(df.columns)}")
 
     # Extract unique companies for clients.csv
-    clients = df[['company_name', 'date']].copy()
-    clients = clients.dropna(subset=['company_name'])
-    clients['company_name'] = clients['company_name'].str.strip()
-
-    # Remove duplicates, keep first occurrence
-    clients = clients.drop_duplicates(subset=['company_name'], keep='first')
+    # Drop missing and duplicate (after trimming) names in one mask, keeping
+    # the first occurrence, so only one row gather/copy is made
+    names = df['company_name'].str.strip()
+    keep = names.notna() & ~names.duplicated(keep='first')
+    clients = df.loc[keep, ['company_name', 'date']].copy()
+    clients['company_name'] = names[keep]
 
     # Add required fields
     clients['client_id'] = range(1, len(clients) + 1)
     clients['industry'] = 'Various'  # You can categorize later
     clients['company_size'] = 'Unknown'
-    clients['first_engagement_date'] = pd.to_datetime(clients['date'], format='%d/%m/%Y', errors='coerce')
+    clients['first_engagement_date'] = pd.to_datetime(clients['date'], format='%d/%m/%Y',
+                                                      errors='coerce', cache=True)
     clients['last_engagement_date'] = clients['first_engagement_date']  # Will update later
     clients['total_positions_filled'] = 0  # Will calculate if you have roles data
     clients['revenue_generated'] = 0.0
@@ -56,114 +149,139 @@ def preprocess_clients_master():
     return clients, df
 
 
-def preprocess_spocs(clients_df, master_df):
-    """Extract SPOCs from all contact sources."""
+def preprocess_spocs(clients_df, master_df, poc_df=None, leads_df=None, txo_df=None):
+    """Extract SPOCs from all contact sources (optional sources may be None)."""
     print("\nProcessing SPOCs...")
 
     all_spocs = []
 
     # 1. From Clients Master
     print("Extracting from Clients Master...")
-    spocs_master = master_df[['company_name', 'contact_name', 'department',
-                               'contact_email', 'contact_number', 'date']].copy()
-    spocs_master = spocs_master.dropna(subset=['contact_email'])
-    spocs_master['source'] = 'clients_master'
+    spocs_master = master_df.loc[master_df['contact_email'].notna(),
+                                 ['company_name', 'contact_name', 'department',
+                                  'contact_email', 'contact_number', 'date']].copy()
+    spocs_master['source'] = source_column('clients_master', len(spocs_master))
     all_spocs.append(spocs_master)
 
     # 2. From Client POC
-    try:
-        print("Extracting from Client POC...")
-        poc_df = pd.read_csv("data/raw/Sales Tracker - Client POC.csv")
-        poc_df = clean_column_names(poc_df)
-        spocs_poc = poc_df[['company_name', 'contact_name', 'contact_email', 'date']].copy()
-        spocs_poc['department'] = None
-        spocs_poc['contact_number'] = None
-        spocs_poc['source'] = 'client_poc'
-        all_spocs.append(spocs_poc)
-    except Exception as e:
-        print(f"Could not process Client POC: {e}")
+    if poc_df is not None:
+        try:
+            print("Extracting from Client POC...")
+            poc_df = clean_column_names(poc_df)
+            spocs_poc = poc_df.loc[poc_df['contact_email'].notna(),
+                                   ['company_name', 'contact_name', 'contact_email', 'date']].copy()
+            spocs_poc['department'] = None
+            spocs_poc['contact_number'] = None
+            spocs_poc['source'] = source_column('client_poc', len(spocs_poc))
+            all_spocs.append(spocs_poc)
+        except KeyError as e:
+            print(f"Could not process Client POC: missing column {e}")
 
     # 3. From New Leads
-    try:
-        print("Extracting from New Leads...")
-        leads_df = pd.read_csv("data/raw/Sales Tracker - New Leads.csv")
-        leads_df = clean_column_names(leads_df)
-        spocs_leads = leads_df[['company_name', 'name', 'contact_email',
-                                'contact_number', 'linkedin_url', 'date']].copy()
-        spocs_leads = spocs_leads.rename(columns={'name': 'contact_name'})
-        spocs_leads['department'] = None
-        spocs_leads['source'] = 'new_leads'
-        all_spocs.append(spocs_leads)
-    except Exception as e:
-        print(f"Could not process New Leads: {e}")
+    if leads_df is not None:
+        try:
+            print("Extracting from New Leads...")
+            leads_df = clean_column_names(leads_df)
+            spocs_leads = leads_df.loc[leads_df['contact_email'].notna(),
+                                       ['company_name', 'name', 'contact_email',
+                                        'contact_number', 'linkedin_url', 'date']].copy()
+            spocs_leads = spocs_leads.rename(columns={'name': 'contact_name'})
+            spocs_leads['department'] = None
+            spocs_leads['source'] = source_column('new_leads', len(spocs_leads))
+            all_spocs.append(spocs_leads)
+        except KeyError as e:
+            print(f"Could not process New Leads: missing column {e}")
 
     # 4. From Txo Clientele
-    try:
-        print("Extracting from Txo Clientele...")
-        txo_df = pd.read_csv("data/raw/Strategy_Sourcing_Sales - Txo Clientele.csv")
-        txo_df = clean_column_names(txo_df)
-        print(f"Txo Clientele columns: {list(txo_df.columns)}")
-
-        # Check what columns are available
-        available_cols = []
-        if 'company_name' in txo_df.columns or 'company' in txo_df.columns:
-            company_col = 'company_name' if 'company_name' in txo_df.columns else 'company'
-            available_cols.append(company_col)
-
-        if available_cols:
-            spocs_txo = txo_df[available_cols].copy()
-            if 'company' in spocs_txo.columns:
-                spocs_txo = spocs_txo.rename(columns={'company': 'company_name'})
-            spocs_txo['contact_name'] = None
-            spocs_txo['contact_email'] = None
-            spocs_txo['contact_number'] = None
-            spocs_txo['department'] = None
-            spocs_txo['date'] = None
-            spocs_txo['source'] = 'txo_clientele'
-            all_spocs.append(spocs_txo)
-    except Exception as e:
-        print(f"Could not process Txo Clientele: {e}")
-
-    # Combine all SPOCs
-    combined_spocs = pd.concat(all_spocs, ignore_index=True, sort=False)
-
-    print(f"Combined {len(combined_spocs)} total SPOC records")
-
-    # Clean up
-    combined_spocs['contact_email'] = combined_spocs['contact_email'].str.lower().str.strip()
-
-    # Remove duplicates (keep first occurrence)
-    combined_spocs = combined_spocs.dropna(subset=['contact_email'])
-    combined_spocs = combined_spocs.drop_duplicates(subset=['contact_email'], keep='first')
+    if txo_df is not None:
+        try:
+            print("Extracting from Txo Clientele...")
+            txo_df = clean_column_names(txo_df)
+            print(f"Txo Clientele columns: {list(txo_df.columns)}")
+
+            # Check what columns are available
+            available_cols = []
+            if 'company_name' in txo_df.columns or 'company' in txo_df.columns:
+                company_col = 'company_name' if 'company_name' in txo_df.columns else 'company'
+                available_cols.append(company_col)
+
+            if available_cols:
+                spocs_txo = txo_df[available_cols].copy()
+                if 'company' in spocs_txo.columns:
+                    spocs_txo = spocs_txo.rename(columns={'company': 'company_name'})
+                spocs_txo['contact_name'] = None
+                spocs_txo['contact_email'] = None
+                spocs_txo['contact_number'] = None
+                spocs_txo['department'] = None
+                spocs_txo['date'] = None
+                spocs_txo['source'] = source_column('txo_clientele', len(spocs_txo))
+                all_spocs.append(spocs_txo)
+        except KeyError as e:
+            print(f"Could not process Txo Clientele: missing column {e}")
+
+    print(f"Combined {sum(len(spocs) for spocs in all_spocs)} total SPOC records")
+
+    # Remove duplicates across sources in order (keep first occurrence),
+    # then combine the already-deduped frames once
+    seen_emails = set()
+    deduped = list(dedupe_by_email(all_spocs, seen_emails))
+    if not deduped:
+        # No source had any email: keep the combined columns, with no rows.
+        # All-blank columns read as Arrow nulls, so type them as text to
+        # keep the usual spocs schema
+        deduped = [spocs.iloc[:0].astype({col: TEXT_DTYPE for col in spocs.columns if col != 'source'})
+                   for spocs in all_spocs]
+    combined_spocs = pd.concat(deduped, ignore_index=True, sort=False)
 
     print(f"After deduplication: {len(combined_spocs)} unique SPOCs")
 
+    # Few companies relative to contacts: the map/factorize below then work
+    # on category codes rather than repeated strings
+    combined_spocs['company_name'] = combined_spocs['company_name'].astype('category')
+
     # Create client_id mapping
-    client_map = clients_df.set_index('company_name')['client_id'].to_dict()
+    client_map = dict(zip(clients_df['company_name'].to_numpy(),
+                          clients_df['client_id'].to_numpy()))
     combined_spocs['client_id'] = combined_spocs['company_name'].map(client_map)
 
     # Fill in missing client_ids (for new companies not in clients.csv)
-    missing_companies = combined_spocs[combined_spocs['client_id'].isna()]['company_name'].unique()
-    if len(missing_companies) > 0:
+    missing_mask = combined_spocs['client_id'].isna() & combined_spocs['company_name'].notna()
+    if missing_mask.any():
+        # One hash pass numbers the new companies in order of first appearance
+        codes, missing_companies = pd.factorize(combined_spocs.loc[missing_mask, 'company_name'])
         print(f"Found {len(missing_companies)} new companies in SPOCs, adding to clients...")
 
         # Add new clients
         max_id = clients_df['client_id'].max()
-        for i, company in enumerate(missing_companies):
-            if pd.notna(company):
-                combined_spocs.loc[combined_spocs['company_name'] == company, 'client_id'] = max_id + i + 1
+        combined_spocs.loc[missing_mask, 'client_id'] = codes + max_id + 1
+
+    # Every source's date column is read as d/m/Y text; unparseable dates
+    # become NaT. The one array feeds both first and last contact dates
+    contact_dates = pd.to_datetime(combined_spocs['date'], format='%d/%m/%Y', errors='coerce',
+                                   cache=True).to_numpy().astype('datetime64[us]')
+
+    # Only New Leads carries LinkedIn URLs, and it may be missing or empty
+    if 'linkedin_url' in combined_spocs:
+        linkedin_urls = combined_spocs['linkedin_url'].fillna('')
+    else:
+        linkedin_urls = pd.Series('', index=combined_spocs.index, dtype=TEXT_DTYPE)
+
+    # Materialize the id columns with their final dtype up front; int32 is
+    # ample for row/client ids and halves their footprint
+    spoc_ids = np.arange(1, len(combined_spocs) + 1, dtype=np.int32)
+    client_ids = combined_spocs['client_id'].fillna(0).to_numpy(dtype=np.int32)
 
     # Create standardized SPOC dataframe
     spocs = pd.DataFrame({
-        'spoc_id': range(1, len(combined_spocs) + 1),
-        'client_id': combined_spocs['client_id'].fillna(0).astype(int),
+        'spoc_id': spoc_ids,
+        'client_id': client_ids,
         'full_name': combined_spocs['contact_name'].fillna('Unknown'),
         'email': combined_spocs['contact_email'],
         'phone': combined_spocs['contact_number'].fillna(''),
         'job_title': combined_spocs['department'].fillna(''),
-        'linkedin_url': combined_spocs.get('linkedin_url', '').fillna(''),
-        'first_contact_date': pd.to_datetime(combined_spocs['date'], format='%d/%m/%Y', errors='coerce'),
-        'last_contact_date': pd.to_datetime(combined_spocs['date'], format='%d/%m/%Y', errors='coerce'),
+        'linkedin_url': linkedin_urls,
+        'first_contact_date': contact_dates,
+        'last_contact_date': contact_dates,
         'is_active': 1
     })
 
@@ -177,11 +295,15 @@ def main():
     print("=" * 80)
     print()
 
+    # Load all source files
+    raw = load_raw_files()
+
     # Process clients
-    clients_df, master_df = preprocess_clients_master()
+    clients_df, master_df = preprocess_clients_master(raw['clients_master'])
 
     # Process SPOCs
-    spocs_df = preprocess_spocs(clients_df, master_df)
+    spocs_df = preprocess_spocs(clients_df, master_df, raw['client_poc'],
+                                raw['new_leads'], raw['txo_clientele'])
 
     # Save to standard filenames
     output_dir = Path("data/raw")
@@ -192,6 +314,11 @@ def main():
     spocs_df.to_csv(output_dir / "spocs.csv", index=False)
     print(f"✅ Saved {len(spocs_df)} SPOCs to spocs.csv")
 
+    # Typed, compressed twins for validate_data.py; the CSVs stay for humans
+    clients_df.to_parquet(output_dir / "clients.parquet", engine='pyarrow', compression='zstd')
+    spocs_df.to_parquet(output_dir / "spocs.parquet", engine='pyarrow', compression='zstd')
+    print("✅ Saved clients.parquet and spocs.parquet")
+
     # Print summary
     print()
     print("=" * 80)
@@ -12,6 +12,34 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 import sys
 
+MBOX_BUFFER_SIZE = 1 << 20  # 1 MB
+
+# ISO dates/timestamps (as written by to_csv) or d/m/y with / or - separators
+DATE_PATTERN = (r'^(?:\d{4}-\d{1,2}-\d{1,2}(?:[ T][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?'
+                r'|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})$')
+
+
+def count_messages(path: Path) -> int:
+    """
+    Count messages in an mbox by its 'From ' separator lines.
+
+    Reads fixed-size binary blocks so memory stays O(1 MB) regardless of the
+    archive size. The last few bytes of each block are carried over so a
+    separator split across two blocks is still counted.
+    """
+    separator = b'\nFrom '
+    count = 0
+    tail = b'\n'  # so a separator on the very first line counts
+    with open(path, 'rb', buffering=MBOX_BUFFER_SIZE) as f:
+        while True:
+            block = f.read(MBOX_BUFFER_SIZE)
+            if not block:
+                break
+            buf = tail + block
+            count += buf.count(separator)
+            tail = buf[-(len(separator) - 1):]
+    return count
+
 
 class DataValidator:
     def __init__(self):
@@ -19,6 +47,7 @@ class DataValidator:
         self.errors = []
         self.warnings = []
         self.info = []
+        self._clients_df = None  # set by validate_clients_csv, reused for linkage checks
 
     def validate_all(self) -> bool:
         """Validate all data sources. Returns True if valid, False otherwise."""
@@ -46,6 +75,18 @@ class DataValidator:
         # Return overall status
         return len(self.errors) == 0
 
+    def read_table(self, filepath: Path) -> pd.DataFrame:
+        """
+        Read a CSV, preferring its .parquet twin when that is at least as new.
+
+        Parquet keeps the dtypes written by the preprocessors, so there is no
+        text re-parse. A CSV edited after the twin was written still wins.
+        """
+        parquet_path = filepath.with_suffix('.parquet')
+        if parquet_path.exists() and parquet_path.stat().st_mtime >= filepath.stat().st_mtime:
+            return pd.read_parquet(parquet_path)
+        return pd.read_csv(filepath)
+
     def validate_clients_csv(self):
         """Validate clients.csv file."""
         filepath = self.data_dir / "clients.csv"
@@ -55,7 +96,8 @@ class DataValidator:
             return
 
         try:
-            df = pd.read_csv(filepath)
+            df = self.read_table(filepath)
+            self._clients_df = df
 
             # Check required columns
             required_cols = [
@@ -77,13 +119,13 @@ class DataValidator:
                     if null_count > 0:
                         self.warnings.append(f"⚠️  clients.csv: {null_count} null values in '{col}'")
 
-            # Check date formats
+            # Check date formats (shape check only; nulls are reported above)
             for date_col in ['first_engagement_date', 'last_engagement_date']:
-                if date_col in df.columns:
-                    try:
-                        pd.to_datetime(df[date_col], errors='coerce')
-                    except Exception as e:
-                        self.warnings.append(f"⚠️  clients.csv: Invalid date format in '{date_col}'")
+                if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+                    values = df[date_col].dropna().astype('string')
+                    invalid_count = int((~values.str.match(DATE_PATTERN)).sum())
+                    if invalid_count > 0:
+                        self.warnings.append(f"⚠️  clients.csv: {invalid_count} invalid date values in '{date_col}'")
 
             # Check for recommended columns
             recommended_cols = ['total_positions_filled', 'revenue_generated', 'industry']
@@ -104,7 +146,7 @@ class DataValidator:
             return
 
         try:
-            df = pd.read_csv(filepath)
+            df = self.read_table(filepath)
 
             # Check required columns
             required_cols = [
@@ -120,15 +162,17 @@ class DataValidator:
 
             # Check email format
             if 'email' in df.columns:
-                # Basic email validation
-                invalid_emails = df[~df['email'].astype(str).str.contains('@', na=False)]
-                if len(invalid_emails) > 0:
-                    self.warnings.append(f"⚠️  spocs.csv: {len(invalid_emails)} records with invalid email format")
+                # Basic email validation (plain substring scan; missing emails count as invalid).
+                # Cast first: an all-empty or numeric column has no .str accessor
+                emails = df['email'].astype('string')
+                invalid_count = int((~emails.str.contains('@', na=False, regex=False)).sum())
+                if invalid_count > 0:
+                    self.warnings.append(f"⚠️  spocs.csv: {invalid_count} records with invalid email format")
 
                 # Check for duplicate emails
-                duplicate_emails = df[df['email'].duplicated()]
-                if len(duplicate_emails) > 0:
-                    self.warnings.append(f"⚠️  spocs.csv: {len(duplicate_emails)} duplicate email addresses found")
+                duplicate_count = int(df['email'].duplicated().sum())
+                if duplicate_count > 0:
+                    self.warnings.append(f"⚠️  spocs.csv: {duplicate_count} duplicate email addresses found")
 
             # Check for recommended columns
             recommended_cols = ['job_title', 'linkedin_url', 'last_contact_date']
@@ -141,12 +185,15 @@ class DataValidator:
             if 'client_id' in df.columns:
                 clients_path = self.data_dir / "clients.csv"
                 if clients_path.exists():
-                    clients_df = pd.read_csv(clients_path)
+                    clients_df = self._clients_df
+                    if clients_df is None:
+                        clients_df = self.read_table(clients_path)
                     if 'client_id' in clients_df.columns:
-                        # Check for orphaned SPOCs
-                        orphaned = df[~df['client_id'].isin(clients_df['client_id'])]
-                        if len(orphaned) > 0:
-                            self.warnings.append(f"⚠️  spocs.csv: {len(orphaned)} SPOCs have client_id not in clients.csv")
+                        # Check for orphaned SPOCs (count only, no row subset)
+                        known_ids = set(clients_df['client_id'].to_numpy())
+                        orphan_count = int((~df['client_id'].isin(known_ids)).sum())
+                        if orphan_count > 0:
+                            self.warnings.append(f"⚠️  spocs.csv: {orphan_count} SPOCs have client_id not in clients.csv")
 
         except Exception as e:
             self.errors.append(f"❌ Error reading spocs.csv: {e}")
@@ -227,6 +274,13 @@ class DataValidator:
         else:
             self.info.append(f"✅ {mbox_file.name} found ({size_mb:.1f} MB)")
 
+        # Check it actually contains messages
+        message_count = count_messages(mbox_file)
+        if message_count == 0:
+            self.warnings.append(f"⚠️  {mbox_file.name}: no messages found (no 'From ' separator lines)")
+        else:
+            self.info.append(f"✅ {mbox_file.name}: {message_count} messages")
+
     def print_results(self):
         """Print validation results."""
         print()
@@ -3,73 +3,320 @@
 Simple CRM Web Server using only Python standard library
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from contextlib import contextmanager
+from html import escape
+import functools
+import hashlib
 import sqlite3
+import gzip
 import json
+import queue
+import re
+import threading
+import time
 import urllib.parse
 
-class CRMHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        parsed = urllib.parse.urlparse(self.path)
-        path = parsed.path
+# Optional faster JSON encoders; the server still runs on the stdlib alone
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def json_bytes(obj):
+    """Serialize obj to compact UTF-8 JSON with the fastest encoder available."""
+    if orjson is not None:
+        return orjson.dumps(obj)  # already bytes
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+DB_PATH = '/tmp/crm.db'
+
+# Applied to every pooled connection (see DB_POOL_SIZE). Read-heavy
+# workload: WAL lets the request threads read concurrently, and each
+# connection keeps its page cache across requests
+DB_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',      # 64 MB
+    'PRAGMA mmap_size=268435456',    # 256 MB
+)
+
+# Indexes the page queries rely on: top-N by priority/positions become index
+# walks bounded by LIMIT, the funnel counts scan a narrow covering index, and
+# contact detail pages are a single lookup by email
+DB_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS idx_contacts_priority ON contacts(priority_score DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_contacts_funnel ON contacts(funnel_stage)',
+    'CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email)',
+    'CREATE INDEX IF NOT EXISTS idx_companies_positions ON companies(total_positions_filled DESC)',
+    'CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(company_name)',
+)
+
+# Queries are module constants so every request passes sqlite3 the identical
+# string and hits the per-connection prepared statement cache
+DB_CACHED_STATEMENTS = 256
+
+# Badge class for a contact's funnel stage, computed in SQL with the row
+FUNNEL_BADGE_SQL = '''CASE WHEN instr(funnel_stage, 'bottom') > 0 THEN 'badge-green'
+                   WHEN instr(funnel_stage, 'middle') > 0 THEN 'badge-yellow'
+                   ELSE '' END'''
+
+# One scan for all three stats; COUNT(CASE ...) stays 0 on an empty table
+SQL_DASHBOARD_STATS = '''
+    SELECT COUNT(*),
+           COUNT(CASE WHEN funnel_stage LIKE 'bottom%' THEN 1 END),
+           COUNT(CASE WHEN funnel_stage LIKE 'middle%' THEN 1 END)
+    FROM contacts
+'''
+
+SQL_TOP_CONTACTS = f'''
+    SELECT COALESCE(NULLIF(name, ''), 'N/A'),
+           COALESCE(NULLIF(email, ''), 'no-email@unknown.com'),
+           COALESCE(NULLIF(company, ''), 'Unknown'),
+           COALESCE(NULLIF(funnel_stage, ''), 'unclassified'),
+           COALESCE(priority_score, 0) AS score,
+           {FUNNEL_BADGE_SQL}
+    FROM contacts
+    ORDER BY priority_score DESC
+    LIMIT 10
+'''
+
+# Row shape for the contacts listing and its search results
+CONTACT_LIST_COLUMNS = f'''COALESCE(NULLIF(name, ''), 'N/A'),
+           COALESCE(NULLIF(email, ''), 'no-email@unknown.com'),
+           COALESCE(NULLIF(company, ''), 'Unknown'),
+           COALESCE(NULLIF(title, ''), 'N/A'),
+           COALESCE(NULLIF(funnel_stage, ''), 'unclassified'),
+           COALESCE(priority_score, 0) AS score,
+           {FUNNEL_BADGE_SQL}'''
+
+SQL_CONTACTS = f'''
+    SELECT {CONTACT_LIST_COLUMNS}
+    FROM contacts
+    ORDER BY priority_score DESC
+    LIMIT 100
+'''
+
+# Best 100 full-text matches across the whole table, best match first
+SQL_CONTACTS_SEARCH = f'''
+    SELECT {CONTACT_LIST_COLUMNS}
+    FROM contacts
+    JOIN (SELECT rowid, rank FROM contacts_fts
+          WHERE contacts_fts MATCH ? ORDER BY rank LIMIT 100) AS hits
+      ON contacts.rowid = hits.rowid
+    ORDER BY hits.rank
+'''
+
+# Used when the FTS index is unavailable; :pattern is escaped with '\'
+SQL_CONTACTS_LIKE = f'''
+    SELECT {CONTACT_LIST_COLUMNS}
+    FROM contacts
+    WHERE name LIKE :pattern ESCAPE '\\' OR email LIKE :pattern ESCAPE '\\'
+       OR company LIKE :pattern ESCAPE '\\' OR title LIKE :pattern ESCAPE '\\'
+    ORDER BY priority_score DESC
+    LIMIT 100
+'''
+
+# The contact plus its company's stats in one round-trip
+SQL_CONTACT_BY_EMAIL = '''
+    SELECT c.email, c.name, c.company, c.title, c.funnel_stage, c.priority_score,
+           co.total_positions_filled, co.revenue_generated, co.client_status
+    FROM contacts c
+    LEFT JOIN companies co ON co.company_name = c.company
+    WHERE c.email = ?
+    LIMIT 1
+'''
+
+SQL_COMPANIES = '''
+    SELECT COALESCE(NULLIF(company_name, ''), 'Unknown Company'),
+           COALESCE(total_positions_filled, 0),
+           COALESCE(revenue_generated, 0),
+           COALESCE(NULLIF(client_status, ''), 'Unknown'),
+           CASE WHEN client_status = 'active' THEN 'badge-green' ELSE 'badge-yellow' END
+    FROM companies
+    ORDER BY total_positions_filled DESC
+    LIMIT 100
+'''
+
+SQL_CONTACTS_JSON = 'SELECT email, name, company FROM contacts LIMIT 100'
+
+# External-content FTS5 index over the searchable contact fields, kept in
+# sync by triggers. Dropping and reloading contacts drops the triggers too,
+# so the index is rebuilt whenever the schema changes (see search_contacts)
+DB_SEARCH_INDEX = (
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+           name, email, company, title, content='contacts', content_rowid='rowid')''',
+    '''CREATE TRIGGER IF NOT EXISTS contacts_fts_insert AFTER INSERT ON contacts BEGIN
+           INSERT INTO contacts_fts(rowid, name, email, company, title)
+           VALUES (new.rowid, new.name, new.email, new.company, new.title);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS contacts_fts_delete AFTER DELETE ON contacts BEGIN
+           INSERT INTO contacts_fts(contacts_fts, rowid, name, email, company, title)
+           VALUES ('delete', old.rowid, old.name, old.email, old.company, old.title);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS contacts_fts_update AFTER UPDATE ON contacts BEGIN
+           INSERT INTO contacts_fts(contacts_fts, rowid, name, email, company, title)
+           VALUES ('delete', old.rowid, old.name, old.email, old.company, old.title);
+           INSERT INTO contacts_fts(rowid, name, email, company, title)
+           VALUES (new.rowid, new.name, new.email, new.company, new.title);
+       END''',
+    "INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')",
+)
+
+# Connections shared by the request threads; also bounds concurrent DB work
+DB_POOL_SIZE = 8
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+# PRAGMA schema_version as of the last search index build
+_search_schema_version = None
+_search_index_lock = threading.Lock()
+
+
+def open_db():
+    """Open a connection with the tuned pragmas, usable from any thread."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                           cached_statements=DB_CACHED_STATEMENTS)
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def ensure_indexes():
+    """Create the indexes in DB_INDEXES if they don't exist yet."""
+    conn = open_db()
+    try:
+        for statement in DB_INDEXES:
+            conn.execute(statement)
+        conn.execute('PRAGMA optimize')
+    finally:
+        conn.close()
 
-        if path == '/' or path == '/index.html':
-            self.serve_dashboard()
-        elif path == '/contacts':
-            self.serve_contacts()
-        elif path.startswith('/contact/'):
-            email = path.split('/')[-1]
-            self.serve_contact_detail(urllib.parse.unquote(email))
-        elif path == '/companies':
-            self.serve_companies()
-        elif path == '/api/contacts':
-            self.serve_contacts_json()
-        else:
-            self.send_error(404)
 
-    def serve_dashboard(self):
-        conn = sqlite3.connect('/tmp/crm.db')
-        c = conn.cursor()
+def schema_version(conn):
+    return conn.execute('PRAGMA schema_version').fetchone()[0]
 
-        total = c.execute('SELECT COUNT(*) FROM contacts').fetchone()[0]
-        bottom = c.execute("SELECT COUNT(*) FROM contacts WHERE funnel_stage LIKE 'bottom%'").fetchone()[0]
-        middle = c.execute("SELECT COUNT(*) FROM contacts WHERE funnel_stage LIKE 'middle%'").fetchone()[0]
 
-        top_contacts = c.execute('''
-            SELECT name, email, company, funnel_stage, priority_score
-            FROM contacts
-            ORDER BY priority_score DESC
-            LIMIT 10
-        ''').fetchall()
+def build_search_index(conn):
+    """Create (or rebuild) the contacts full-text index in DB_SEARCH_INDEX."""
+    global _search_schema_version
+    try:
+        for statement in DB_SEARCH_INDEX:
+            conn.execute(statement)
+    finally:
+        # Also on failure (e.g. no FTS5): don't retry until the schema changes
+        _search_schema_version = schema_version(conn)
 
+
+def ensure_search_index():
+    """Build the contacts full-text index on a fresh connection."""
+    conn = open_db()
+    try:
+        build_search_index(conn)
+    finally:
         conn.close()
 
-        html = f'''<!DOCTYPE html>
+
+def like_pattern(query):
+    """Return a LIKE pattern matching query literally anywhere (escape char '\\')."""
+    escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def search_contacts(conn, query):
+    """Return a cursor over the top contacts matching query, via FTS if available."""
+    # Each whitespace-separated term becomes a quoted prefix match, so user
+    # input can't produce FTS syntax errors
+    terms = ' '.join('"%s"*' % term.replace('"', '""') for term in query.split())
+    try:
+        if schema_version(conn) != _search_schema_version:
+            with _search_index_lock:
+                if schema_version(conn) != _search_schema_version:
+                    build_search_index(conn)
+        return conn.execute(SQL_CONTACTS_SEARCH, (terms,))
+    except sqlite3.OperationalError:
+        return conn.execute(SQL_CONTACTS_LIKE, {'pattern': like_pattern(query)})
+
+
+def get_db_pool():
+    """Return the connection pool, opening its connections on first use."""
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            pool = queue.Queue(maxsize=DB_POOL_SIZE)
+            for _ in range(DB_POOL_SIZE):
+                pool.put(open_db())
+            _db_pool = pool
+    return _db_pool
+
+
+@contextmanager
+def db_connection():
+    """Borrow a pooled connection; callers beyond DB_POOL_SIZE wait for one."""
+    pool = get_db_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
+
+# Shared stylesheet for every page, served from /static/crm.css so browsers
+# fetch it once instead of receiving it inline with each response
+CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: -apple-system, system-ui, sans-serif; background: #f5f7fa; }
+.header { background: #2c3e50; color: white; padding: 20px; }
+.header h1 { font-size: 24px; }
+.nav { background: white; padding: 15px 20px; border-bottom: 1px solid #ddd; }
+.nav a { text-decoration: none; color: #2c3e50; margin-right: 30px; padding: 10px 0; border-bottom: 3px solid transparent; }
+.nav a:hover, .nav a.active { color: #3498db; border-bottom-color: #3498db; }
+.container { max-width: 1400px; margin: 0 auto; padding: 30px 20px; }
+.container-narrow { max-width: 1200px; }
+.stats { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin-bottom: 30px; }
+.stat-card { background: white; padding: 25px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.stat-card h3 { font-size: 14px; color: #7f8c8d; margin-bottom: 10px; text-transform: uppercase; }
+.stat-card .number { font-size: 36px; font-weight: 600; color: #2c3e50; }
+.search { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.search input { width: 100%; padding: 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; }
+table { width: 100%; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-collapse: collapse; }
+th { text-align: left; padding: 15px; background: #f8f9fa; font-weight: 600; border-bottom: 2px solid #e1e8ed; }
+td { padding: 15px; border-bottom: 1px solid #f1f3f5; }
+tr:hover { background: #f8f9fa; }
+.badge { display: inline-block; padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; }
+.badge-green { background: #d4edda; color: #155724; }
+.badge-yellow { background: #fff3cd; color: #856404; }
+.profile { background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.profile h1 { font-size: 28px; margin-bottom: 10px; }
+.profile .email { color: #7f8c8d; margin-bottom: 20px; }
+.info-grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin-top: 20px; }
+.info-item { padding: 15px; background: #f8f9fa; border-radius: 6px; }
+.info-item label { font-size: 12px; color: #7f8c8d; text-transform: uppercase; display: block; margin-bottom: 5px; }
+.info-item value { font-size: 16px; color: #2c3e50; font-weight: 600; }
+.back-btn { display: inline-block; padding: 10px 20px; background: #95a5a6; color: white; text-decoration: none; border-radius: 4px; margin-bottom: 20px; }
+"""
+CSS_BYTES = CSS.encode()
+CSS_ETAG = '"%s"' % hashlib.sha1(CSS_BYTES).hexdigest()
+CSS_CACHE_CONTROL = 'public, max-age=86400'
+
+
+# Page templates, built once at import. Static pieces are pre-encoded bytes;
+# the per-request parts (rows, stats, profile) are str %-templates, encoded
+# and joined between them.
+DASHBOARD_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
     <title>TalentXO CRM</title>
     <meta charset="UTF-8">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, system-ui, sans-serif; background: #f5f7fa; }}
-        .header {{ background: #2c3e50; color: white; padding: 20px; }}
-        .header h1 {{ font-size: 24px; }}
-        .nav {{ background: white; padding: 15px 20px; border-bottom: 1px solid #ddd; }}
-        .nav a {{ text-decoration: none; color: #2c3e50; margin-right: 30px; padding: 10px 0; border-bottom: 3px solid transparent; }}
-        .nav a:hover, .nav a.active {{ color: #3498db; border-bottom-color: #3498db; }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 30px 20px; }}
-        .stats {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin-bottom: 30px; }}
-        .stat-card {{ background: white; padding: 25px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .stat-card h3 {{ font-size: 14px; color: #7f8c8d; margin-bottom: 10px; text-transform: uppercase; }}
-        .stat-card .number {{ font-size: 36px; font-weight: 600; color: #2c3e50; }}
-        table {{ width: 100%; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-collapse: collapse; }}
-        th {{ text-align: left; padding: 15px; background: #f8f9fa; font-weight: 600; border-bottom: 2px solid #e1e8ed; }}
-        td {{ padding: 15px; border-bottom: 1px solid #f1f3f5; }}
-        tr:hover {{ background: #f8f9fa; }}
-        .badge {{ display: inline-block; padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; }}
-        .badge-green {{ background: #d4edda; color: #155724; }}
-        .badge-yellow {{ background: #fff3cd; color: #856404; }}
-    </style>
+    <link rel="stylesheet" href="/static/crm.css">
 </head>
 <body>
     <div class="header">
@@ -84,21 +331,26 @@ class CRMHandler(BaseHTTPRequestHandler):
     </div>
 
     <div class="container">
-        <div class="stats">
+'''.encode()
+
+# The only per-request part of the dashboard head
+DASHBOARD_STATS = '''        <div class="stats">
             <div class="stat-card">
                 <h3>Total Contacts</h3>
-                <div class="number">{total:,}</div>
+                <div class="number">%s</div>
             </div>
             <div class="stat-card">
                 <h3>Bottom Funnel</h3>
-                <div class="number" style="color: #27ae60;">{bottom}</div>
+                <div class="number" style="color: #27ae60;">%s</div>
             </div>
             <div class="stat-card">
                 <h3>Middle Funnel</h3>
-                <div class="number" style="color: #f39c12;">{middle}</div>
+                <div class="number" style="color: #f39c12;">%s</div>
             </div>
         </div>
+'''
 
+DASHBOARD_TABLE_HEAD = '''
         <h2 style="margin-bottom: 20px; font-size: 20px;">🔥 Top Priority Contacts</h2>
         <table>
             <thead>
@@ -110,74 +362,14 @@ class CRMHandler(BaseHTTPRequestHandler):
                     <th>Action</th>
                 </tr>
             </thead>
-            <tbody>'''
-
-        for row in top_contacts:
-            name, email, company, funnel, score = row
-            name = name or "N/A"
-            email = email or "no-email@unknown.com"
-            company = company or "Unknown"
-            funnel = funnel or "unclassified"
-            score = score if score is not None else 0
-            badge_class = 'badge-green' if 'bottom' in funnel else ('badge-yellow' if 'middle' in funnel else '')
-            html += f'''
-                <tr>
-                    <td><strong>{name}</strong><br><small style="color: #7f8c8d;">{email}</small></td>
-                    <td>{company}</td>
-                    <td><span class="badge {badge_class}">{funnel}</span></td>
-                    <td><strong>{score:.1f}</strong></td>
-                    <td><a href="/contact/{urllib.parse.quote(email)}" style="color: #3498db; text-decoration: none;">View →</a></td>
-                </tr>'''
-
-        html += '''
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>'''
-
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
-
-    def serve_contacts(self):
-        conn = sqlite3.connect('/tmp/crm.db')
-        c = conn.cursor()
+            <tbody>'''.encode()
 
-        contacts = c.execute('''
-            SELECT name, email, company, title, funnel_stage, priority_score
-            FROM contacts
-            ORDER BY priority_score DESC
-            LIMIT 100
-        ''').fetchall()
-
-        conn.close()
-
-        html = '''<!DOCTYPE html>
+CONTACTS_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
     <title>Contacts - TalentXO CRM</title>
     <meta charset="UTF-8">
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: -apple-system, system-ui, sans-serif; background: #f5f7fa; }
-        .header { background: #2c3e50; color: white; padding: 20px; }
-        .header h1 { font-size: 24px; }
-        .nav { background: white; padding: 15px 20px; border-bottom: 1px solid #ddd; }
-        .nav a { text-decoration: none; color: #2c3e50; margin-right: 30px; padding: 10px 0; border-bottom: 3px solid transparent; }
-        .nav a:hover, .nav a.active { color: #3498db; border-bottom-color: #3498db; }
-        .container { max-width: 1400px; margin: 0 auto; padding: 30px 20px; }
-        .search { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .search input { width: 100%; padding: 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; }
-        table { width: 100%; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-collapse: collapse; }
-        th { text-align: left; padding: 15px; background: #f8f9fa; font-weight: 600; border-bottom: 2px solid #e1e8ed; }
-        td { padding: 15px; border-bottom: 1px solid #f1f3f5; }
-        tr:hover { background: #f8f9fa; }
-        .badge { display: inline-block; padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; }
-        .badge-green { background: #d4edda; color: #155724; }
-        .badge-yellow { background: #fff3cd; color: #856404; }
-    </style>
+    <link rel="stylesheet" href="/static/crm.css">
 </head>
 <body>
     <div class="header">
@@ -191,9 +383,12 @@ class CRMHandler(BaseHTTPRequestHandler):
     </div>
 
     <div class="container">
-        <div class="search">
-            <input type="text" id="searchBox" placeholder="Search contacts by name, company, or email..." onkeyup="filterTable()">
-        </div>
+        <form class="search" action="/contacts" method="get">
+            <input type="text" name="q" value="'''.encode()
+
+# Follows the (escaped) current search query
+CONTACTS_TABLE_HEAD = '''" placeholder="Search contacts by name, company, title, or email...">
+        </form>
 
         <table id="contactsTable">
             <thead>
@@ -206,82 +401,100 @@ class CRMHandler(BaseHTTPRequestHandler):
                     <th>Action</th>
                 </tr>
             </thead>
-            <tbody>'''
-
-        for row in contacts:
-            name, email, company, title, funnel, score = row
-            name = name or "N/A"
-            email = email or "no-email@unknown.com"
-            company = company or "Unknown"
-            title = title or "N/A"
-            funnel = funnel or "unclassified"
-            score = score if score is not None else 0
-            badge_class = 'badge-green' if 'bottom' in funnel else ('badge-yellow' if 'middle' in funnel else '')
-            html += f'''
+            <tbody>'''.encode()
+
+COMPANIES_HEAD = '''<!DOCTYPE html>
+<html>
+<head>
+    <title>Companies - TalentXO CRM</title>
+    <link rel="stylesheet" href="/static/crm.css">
+</head>
+<body>
+    <div class="header">
+        <h1>🎯 TalentXO CRM</h1>
+    </div>
+
+    <div class="nav">
+        <a href="/">Dashboard</a>
+        <a href="/contacts">Contacts</a>
+        <a href="/companies" class="active">Companies</a>
+    </div>
+
+    <div class="container">
+        <h2 style="margin-bottom: 20px;">Companies</h2>
+        <table>
+            <thead>
                 <tr>
-                    <td><strong>{name}</strong><br><small style="color: #7f8c8d;">{email}</small></td>
-                    <td>{company}</td>
-                    <td>{title}</td>
-                    <td><span class="badge {badge_class}">{funnel}</span></td>
-                    <td><strong>{score:.1f}</strong></td>
-                    <td><a href="/contact/{urllib.parse.quote(email)}" style="color: #3498db; text-decoration: none; font-weight: 600;">View →</a></td>
-                </tr>'''
+                    <th>Company Name</th>
+                    <th>Positions Filled</th>
+                    <th>Revenue Generated</th>
+                    <th>Status</th>
+                </tr>
+            </thead>
+            <tbody>'''.encode()
 
-        html += '''
+# Shared by the dashboard, contacts and companies tables
+TABLE_PAGE_TAIL = '''
             </tbody>
         </table>
     </div>
-
-    <script>
-    function filterTable() {
-        const search = document.getElementById('searchBox').value.toLowerCase();
-        const table = document.getElementById('contactsTable');
-        const rows = table.getElementsByTagName('tr');
-
-        for (let i = 1; i < rows.length; i++) {
-            const text = rows[i].textContent.toLowerCase();
-            rows[i].style.display = text.includes(search) ? '' : 'none';
-        }
-    }
-    </script>
 </body>
-</html>'''
+</html>'''.encode()
 
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
+# Per-row %-templates for the listing tables
+DASHBOARD_ROW = '''
+                <tr>
+                    <td><strong>%s</strong><br><small style="color: #7f8c8d;">%s</small></td>
+                    <td>%s</td>
+                    <td><span class="badge %s">%s</span></td>
+                    <td><strong>%.1f</strong></td>
+                    <td><a href="/contact/%s" style="color: #3498db; text-decoration: none;">View →</a></td>
+                </tr>'''
 
-    def serve_contact_detail(self, email):
-        conn = sqlite3.connect('/tmp/crm.db')
-        c = conn.cursor()
+CONTACTS_ROW = '''
+                <tr>
+                    <td><strong>%s</strong><br><small style="color: #7f8c8d;">%s</small></td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td><span class="badge %s">%s</span></td>
+                    <td><strong>%.1f</strong></td>
+                    <td><a href="/contact/%s" style="color: #3498db; text-decoration: none; font-weight: 600;">View →</a></td>
+                </tr>'''
 
-        contact = c.execute('SELECT * FROM contacts WHERE email = ?', (email,)).fetchone()
+COMPANIES_ROW = '''
+                <tr>
+                    <td><strong>%s</strong></td>
+                    <td>%s</td>
+                    <td>$%s</td>
+                    <td><span class="badge %s">%s</span></td>
+                </tr>'''
 
-        if not contact:
-            self.send_error(404)
-            return
+# Shown on the contact page when the contact's company is in companies
+DETAIL_COMPANY_STATS = '''
+            <div class="info-grid">
+                <div class="info-item">
+                    <label>Positions Filled</label>
+                    <value>%s</value>
+                </div>
+                <div class="info-item">
+                    <label>Revenue Generated</label>
+                    <value>$%s</value>
+                </div>
+                <div class="info-item">
+                    <label>Client Status</label>
+                    <value>%s</value>
+                </div>
+            </div>
+'''
 
-        html = f'''<!DOCTYPE html>
+DETAIL_HEAD = '''<!DOCTYPE html>
 <html>
 <head>
-    <title>{contact[1] or "Contact"} - TalentXO CRM</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, system-ui, sans-serif; background: #f5f7fa; }}
-        .header {{ background: #2c3e50; color: white; padding: 20px; }}
-        .nav {{ background: white; padding: 15px 20px; border-bottom: 1px solid #ddd; }}
-        .nav a {{ text-decoration: none; color: #2c3e50; margin-right: 30px; }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 30px 20px; }}
-        .profile {{ background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .profile h1 {{ font-size: 28px; margin-bottom: 10px; }}
-        .profile .email {{ color: #7f8c8d; margin-bottom: 20px; }}
-        .info-grid {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin-top: 20px; }}
-        .info-item {{ padding: 15px; background: #f8f9fa; border-radius: 6px; }}
-        .info-item label {{ font-size: 12px; color: #7f8c8d; text-transform: uppercase; display: block; margin-bottom: 5px; }}
-        .info-item value {{ font-size: 16px; color: #2c3e50; font-weight: 600; }}
-        .back-btn {{ display: inline-block; padding: 10px 20px; background: #95a5a6; color: white; text-decoration: none; border-radius: 4px; margin-bottom: 20px; }}
-    </style>
+    <title>'''.encode()
+
+# Follows the (escaped) page title
+DETAIL_NAV = ''' - TalentXO CRM</title>
+    <link rel="stylesheet" href="/static/crm.css">
 </head>
 <body>
     <div class="header">
@@ -294,145 +507,310 @@ class CRMHandler(BaseHTTPRequestHandler):
         <a href="/companies">Companies</a>
     </div>
 
-    <div class="container">
+    <div class="container container-narrow">
         <a href="/contacts" class="back-btn">← Back to Contacts</a>
 
         <div class="profile">
-            <h1>{contact[1] or "N/A"}</h1>
-            <div class="email">{contact[0]}</div>
+'''.encode()
+
+DETAIL_PROFILE = '''            <h1>%s</h1>
+            <div class="email">%s</div>
 
             <div class="info-grid">
                 <div class="info-item">
                     <label>Company</label>
-                    <value>{contact[2] or "Unknown"}</value>
+                    <value>%s</value>
                 </div>
                 <div class="info-item">
                     <label>Title</label>
-                    <value>{contact[3] or "N/A"}</value>
+                    <value>%s</value>
                 </div>
                 <div class="info-item">
                     <label>Funnel Stage</label>
-                    <value>{contact[4]}</value>
+                    <value>%s</value>
                 </div>
                 <div class="info-item">
                     <label>Priority Score</label>
-                    <value>{contact[5]:.1f if contact[5] else 0}</value>
+                    <value>%.1f</value>
                 </div>
             </div>
-        </div>
+'''
+
+DETAIL_TAIL = '''        </div>
     </div>
 </body>
-</html>'''
+</html>'''.encode()
 
-        conn.close()
+# Escaping for DB values in pages/links. The same names and emails recur on
+# every request, so the results are memoized.
+escape_html = functools.lru_cache(maxsize=4096)(escape)
 
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
 
-    def serve_companies(self):
-        conn = sqlite3.connect('/tmp/crm.db')
-        c = conn.cursor()
+# Anything outside this alphabet needs quote(); within it only '@' changes
+EMAIL_NEEDS_QUOTING = re.compile(r'[^A-Za-z0-9._\-@]').search
 
-        companies = c.execute('''
-            SELECT company_name, total_positions_filled, revenue_generated, client_status
-            FROM companies
-            ORDER BY total_positions_filled DESC
-            LIMIT 100
-        ''').fetchall()
 
-        conn.close()
+@functools.lru_cache(maxsize=4096)
+def quote_email(email):
+    """Quote an email for a /contact/ URL path segment ('/' included)."""
+    if EMAIL_NEEDS_QUOTING(email) is None:
+        return email.replace('@', '%40')
+    return urllib.parse.quote(email, safe='')
 
-        html = '''<!DOCTYPE html>
-<html>
-<head>
-    <title>Companies - TalentXO CRM</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: -apple-system, system-ui, sans-serif; background: #f5f7fa; }
-        .header { background: #2c3e50; color: white; padding: 20px; }
-        .nav { background: white; padding: 15px 20px; border-bottom: 1px solid #ddd; }
-        .nav a { text-decoration: none; color: #2c3e50; margin-right: 30px; padding: 10px 0; border-bottom: 3px solid transparent; }
-        .nav a:hover, .nav a.active { color: #3498db; border-bottom-color: #3498db; }
-        .container { max-width: 1400px; margin: 0 auto; padding: 30px 20px; }
-        table { width: 100%; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); border-collapse: collapse; }
-        th { text-align: left; padding: 15px; background: #f8f9fa; font-weight: 600; border-bottom: 2px solid #e1e8ed; }
-        td { padding: 15px; border-bottom: 1px solid #f1f3f5; }
-        tr:hover { background: #f8f9fa; }
-        .badge { display: inline-block; padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; }
-        .badge-green { background: #d4edda; color: #155724; }
-        .badge-yellow { background: #fff3cd; color: #856404; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🎯 TalentXO CRM</h1>
-    </div>
 
-    <div class="nav">
-        <a href="/">Dashboard</a>
-        <a href="/contacts">Contacts</a>
-        <a href="/companies" class="active">Companies</a>
-    </div>
+# Rendered listing pages are reused for this many seconds; the data changes
+# far less often than the pages are viewed
+PAGE_CACHE_TTL = 30.0
 
-    <div class="container">
-        <h2 style="margin-bottom: 20px;">Companies</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Company Name</th>
-                    <th>Positions Filled</th>
-                    <th>Revenue Generated</th>
-                    <th>Status</th>
-                </tr>
-            </thead>
-            <tbody>'''
-
-        for row in companies:
-            name, positions, revenue, status = row
-            name = name or "Unknown Company"
-            positions = positions if positions is not None else 0
-            revenue = revenue if revenue is not None else 0
-            status = status or "Unknown"
-            badge_class = 'badge-green' if status == 'active' else 'badge-yellow'
-            html += f'''
-                <tr>
-                    <td><strong>{name}</strong></td>
-                    <td>{positions}</td>
-                    <td>${revenue:,.0f}</td>
-                    <td><span class="badge {badge_class}">{status}</span></td>
-                </tr>'''
+# (page, version, encoding) -> (expires_at, body, content_encoding). Bumping
+# the version invalidates every entry, including renders that started before
+# the bump.
+_page_cache = {}
+_page_cache_version = 0
 
-        html += '''
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>'''
 
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
+def _cached_entry(page, render, encoding, now):
+    key = (page, _page_cache_version, encoding)
+    entry = _page_cache.get(key)
+    if entry is None or entry[0] <= now:
+        if encoding is None:
+            entry = (now + PAGE_CACHE_TTL, render(), None)
+        else:
+            # Compress the cached plain body, and expire along with it
+            expires, body, _ = _cached_entry(page, render, None, now)
+            entry = (expires, *compress_body(body))
+        _page_cache[key] = entry
+    return entry
+
+
+def cached_page(page, render, encoding=None):
+    """
+    Return (body, content_encoding) for page, re-rendering at most every
+    PAGE_CACHE_TTL seconds.
+
+    With encoding='gzip' the compressed body is cached too, so repeat hits
+    skip both the render and the compression.
+    """
+    _, body, content_encoding = _cached_entry(page, render, encoding, time.monotonic())
+    return body, content_encoding
+
+
+def invalidate_page_cache():
+    """Drop all cached pages; call after writing to the database."""
+    global _page_cache_version
+    _page_cache_version += 1
+    _page_cache.clear()
+
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+def compress_body(body):
+    """Return (body, content_encoding), gzipped if the body is worth compressing."""
+    if len(body) < GZIP_MIN_BYTES:
+        return body, None
+    # Level 1: most of the size win on repetitive markup for little CPU
+    return gzip.compress(body, compresslevel=1), 'gzip'
+
+
+@functools.lru_cache(maxsize=64)
+def accepts_gzip(accept_encoding):
+    """True if an Accept-Encoding header value allows gzip ('gzip;q=0' refuses it)."""
+    wildcard = False
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            return q > 0
+        if coding == '*':
+            wildcard = q > 0
+    return wildcard
 
-    def serve_contacts_json(self):
-        conn = sqlite3.connect('/tmp/crm.db')
-        c = conn.cursor()
 
-        contacts = c.execute('SELECT email, name, company FROM contacts LIMIT 100').fetchall()
+class CRMHandler(BaseHTTPRequestHandler):
+    # Keep connections open between page loads (needs Content-Length on every response)
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
+        path = parsed.path
+
+        if path == '/' or path == '/index.html':
+            self.send_page('/', self.render_dashboard)
+        elif path == '/contacts':
+            query = urllib.parse.parse_qs(parsed.query).get('q', [''])[0].strip()
+            if query:
+                # Search results aren't cached; the set of queries is unbounded
+                self.send_body(self.render_contacts(query))
+            else:
+                self.send_page('/contacts', self.render_contacts)
+        elif path.startswith('/contact/'):
+            email = path.split('/')[-1]
+            self.serve_contact_detail(urllib.parse.unquote(email))
+        elif path == '/companies':
+            self.send_page('/companies', self.render_companies)
+        elif path == '/api/contacts':
+            self.serve_contacts_json()
+        elif path == '/static/crm.css':
+            self.serve_css()
+        else:
+            self.send_error(404)
+
+    def client_accepts_gzip(self):
+        return accepts_gzip(self.headers.get('Accept-Encoding', ''))
 
-        data = [{'email': r[0], 'name': r[1], 'company': r[2]} for r in contacts]
+    def send_page(self, page, render):
+        """Send a cached page, taking the gzipped copy from the cache if accepted."""
+        body, content_encoding = cached_page(page, render, 'gzip' if self.client_accepts_gzip() else None)
+        self.send_body(body, content_encoding=content_encoding)
 
+    def send_body(self, body, content_type='text/html', headers=None, content_encoding=None):
+        """
+        Send a complete 200 response, gzipped if the client accepts it.
+
+        Pass content_encoding for a body that is already encoded.
+        """
+        if content_encoding is None and self.client_accepts_gzip():
+            body, content_encoding = compress_body(body)
         self.send_response(200)
-        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-type', content_type)
+        self.send_header('Vary', 'Accept-Encoding')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if content_encoding is not None:
+            self.send_header('Content-Encoding', content_encoding)
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
+
+    def serve_css(self):
+        cache_headers = {'ETag': CSS_ETAG, 'Cache-Control': CSS_CACHE_CONTROL}
+        if CSS_ETAG in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            for name, value in cache_headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        self.send_body(CSS_BYTES, 'text/css', cache_headers)
 
-        conn.close()
+    def render_dashboard(self):
+        with db_connection() as conn:
+            c = conn.cursor()
+
+            total, bottom, middle = c.execute(SQL_DASHBOARD_STATS).fetchone()
+
+            parts = [
+                DASHBOARD_HEAD,
+                (DASHBOARD_STATS % (format(total, ','), bottom, middle)).encode(),
+                DASHBOARD_TABLE_HEAD,
+            ]
+
+            for row in c.execute(SQL_TOP_CONTACTS):
+                name, email, company, funnel, score, badge_class = row
+                parts.append((DASHBOARD_ROW % (
+                    escape_html(name), escape_html(email), escape_html(company),
+                    badge_class, escape_html(funnel), score, quote_email(email),
+                )).encode())
+
+        parts.append(TABLE_PAGE_TAIL)
+        return b''.join(parts)
+
+    def render_contacts(self, query=''):
+        parts = [CONTACTS_HEAD, escape_html(query).encode(), CONTACTS_TABLE_HEAD]
+
+        with db_connection() as conn:
+            if query:
+                contacts = search_contacts(conn, query)
+            else:
+                contacts = conn.execute(SQL_CONTACTS)
+
+            for row in contacts:
+                name, email, company, title, funnel, score, badge_class = row
+                parts.append((CONTACTS_ROW % (
+                    escape_html(name), escape_html(email), escape_html(company), escape_html(title),
+                    badge_class, escape_html(funnel), score, quote_email(email),
+                )).encode())
+
+        parts.append(TABLE_PAGE_TAIL)
+        return b''.join(parts)
+
+    def serve_contact_detail(self, email):
+        with db_connection() as conn:
+            contact = conn.execute(SQL_CONTACT_BY_EMAIL, (email,)).fetchone()
+
+        if not contact:
+            self.send_error(404)
+            return
+
+        email, name, company, title, funnel, score, positions, revenue, status = contact
+        page_title = name or 'Contact'
+        name = name or 'N/A'
+        company = company or 'Unknown'
+        title = title or 'N/A'
+        funnel = funnel or 'unclassified'
+        score = score or 0.0
+
+        parts = [
+            DETAIL_HEAD,
+            escape_html(page_title).encode(),
+            DETAIL_NAV,
+            (DETAIL_PROFILE % (
+                escape_html(name), escape_html(email), escape_html(company),
+                escape_html(title), escape_html(funnel), score,
+            )).encode(),
+        ]
+        if positions is not None or revenue is not None or status is not None:
+            parts.append((DETAIL_COMPANY_STATS % (
+                positions or 0, format(revenue or 0, ',.0f'), escape_html(status or 'Unknown'),
+            )).encode())
+        parts.append(DETAIL_TAIL)
+
+        self.send_body(b''.join(parts))
+
+    def render_companies(self):
+        parts = [COMPANIES_HEAD]
+
+        with db_connection() as conn:
+            for row in conn.execute(SQL_COMPANIES):
+                name, positions, revenue, status, badge_class = row
+                parts.append((COMPANIES_ROW % (
+                    escape_html(name), positions, format(revenue, ',.0f'),
+                    badge_class, escape_html(status),
+                )).encode())
+
+        parts.append(TABLE_PAGE_TAIL)
+        return b''.join(parts)
+
+    def serve_contacts_json(self):
+        with db_connection() as conn:
+            data = [{'email': email, 'name': name, 'company': company}
+                    for email, name, company in conn.execute(SQL_CONTACTS_JSON)]
+
+        self.send_body(json_bytes(data), 'application/json')
 
 def run_server(port=5000):
-    server = HTTPServer(('0.0.0.0', port), CRMHandler)
+    try:
+        ensure_indexes()
+    except sqlite3.Error as e:
+        print(f"⚠️  Could not create indexes on {DB_PATH}: {e}")
+    try:
+        ensure_search_index()
+    except sqlite3.Error as e:
+        print(f"⚠️  Could not build the search index, falling back to LIKE: {e}")
+
+    # One thread per request so a slow query doesn't stall other clients;
+    # WAL lets the pooled readers run concurrently
+    server = ThreadingHTTPServer(('0.0.0.0', port), CRMHandler)
+    server.daemon_threads = True
     print("=" * 80)
     print("🎯 TalentXO CRM - Web Server Started")
     print("=" * 80)
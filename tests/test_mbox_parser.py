@@ -0,0 +1,116 @@
+"""Regression tests for the mbox parser."""
+
+import sys
+from datetime import timezone
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+import parsers.mbox_parser as mbox_parser  # noqa: E402
+from parsers.mbox_parser import MboxParser  # noqa: E402
+
+CONFIG_PATH = str(ROOT / 'config' / 'settings.yaml')
+
+MESSAGE = """From sender Mon Jan  1 00:00:00 2024
+From: Ann <ann@client.com>
+To: me@talentxo.com
+Subject: Update {i}
+Date: Mon, 0{day} Jan 2024 10:00:00 {zone}
+Message-ID: <m{i}@client.com>
+
+Thanks for the call.
+
+"""
+
+
+def test_mixed_naive_and_aware_dates(tmp_path):
+    """A '-0000' Date header (naive once parsed) must not break date aggregation."""
+    zones = ['+0530', '-0000', '+0100']
+    mbox_path = tmp_path / 'mixed.mbox'
+    mbox_path.write_text(''.join(
+        MESSAGE.format(i=i, day=i + 1, zone=zone) for i, zone in enumerate(zones)
+    ))
+
+    parser = MboxParser(CONFIG_PATH)
+    contacts_df, conversations_df, _ = parser.parse_mbox(str(mbox_path))
+
+    ann = contacts_df.set_index('email').loc['ann@client.com']
+    assert ann['total_emails'] == 3
+    assert ann['first_contact'].isoformat() == '2024-01-01T10:00:00+05:30'
+    assert ann['last_contact'].isoformat() == '2024-01-03T10:00:00+01:00'
+
+    naive_thread = conversations_df.set_index('thread_id').loc['<m1@client.com>']
+    assert naive_thread['start_date'].tzinfo == timezone.utc
+
+
+THREAD_MESSAGE = """From sender Mon Jan  1 00:00:00 2024
+From: {name} <{sender}>
+To: {recipient}
+Subject: Hiring update {i}
+Date: Mon, {day:02d} Jan 2024 10:00:00 +0530
+Message-ID: <t{i}@example.com>
+In-Reply-To: {reply_to}
+
+{body}
+
+"""
+
+BODIES = [
+    'Please find the job description for a senior engineer at Acme Corp.',
+    'Thanks, let me get back to you next quarter.',
+    'Our proposal attached covers pricing for Globex Solutions.',
+    'I may be interested, happy to keep in touch.',
+]
+
+
+def test_parallel_parse_matches_sequential(tmp_path, monkeypatch):
+    """The process-pool path merges to the same frames as a sequential parse."""
+    messages = []
+    for i in range(12):
+        client = f'client{i % 3}@example.com'
+        outbound = i % 2 == 0
+        messages.append(THREAD_MESSAGE.format(
+            i=i, day=i + 1,
+            name='Recruiter' if outbound else f'Client {i % 3}',
+            sender='recruiter@talentxo.com' if outbound else client,
+            recipient=client if outbound else 'recruiter@talentxo.com',
+            reply_to=f'<t{i % 3}@example.com>' if i >= 3 else '',
+            body=BODIES[i % len(BODIES)],
+        ))
+    mbox_path = tmp_path / 'threads.mbox'
+    mbox_path.write_text(''.join(messages))
+
+    sequential = MboxParser(CONFIG_PATH).parse_mbox(str(mbox_path))
+
+    # Force the pool (split into several chunks) regardless of file size and CPUs
+    monkeypatch.setattr(mbox_parser, 'PARALLEL_MIN_BYTES', 0)
+    monkeypatch.setattr(mbox_parser.os, 'cpu_count', lambda: 3)
+    parallel_parser = MboxParser(CONFIG_PATH)
+    monkeypatch.setattr(parallel_parser, '_parse_sequential', None)
+    parallel = parallel_parser.parse_mbox(str(mbox_path))
+
+    assert len(parallel_parser.emails) == 12
+    for name, expected, actual in zip(['contacts', 'conversations', 'signals'], sequential, parallel):
+        assert not expected.empty, name
+        pd.testing.assert_frame_equal(actual, expected, obj=name)
+
+
+def test_extraction_uses_ascii_word_classes():
+    """Non-ASCII letters are not word characters, in re as in RE2."""
+    parser = MboxParser(CONFIG_PATH)
+    text = 'Hiring a senior engineer in Malmö for Malmö Systems'
+
+    assert parser._extract_roles(text) == {'senior engineer in Malm'}
+    assert parser._extract_companies(text) == {'Malm'}
+
+
+def test_direction_needs_an_address_with_a_domain():
+    """A bare sender string without '@' is never read as one of our domains."""
+    parser = MboxParser(CONFIG_PATH)
+
+    assert parser._detect_direction('recruiter@talentxo.com', []) == 'outbound'
+    assert parser._detect_direction('talentxo.com', []) == 'inbound'
+    assert parser._detect_direction('', []) == 'inbound'
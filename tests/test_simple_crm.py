@@ -0,0 +1,31 @@
+"""Tests for the CRM web server helpers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from simple_crm import accepts_gzip  # noqa: E402
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip', True),
+    ('gzip, deflate, br', True),
+    ('deflate,gzip;q=0.5', True),
+    ('  GZIP ; Q=1 ', True),
+    ('x-gzip', True),
+    ('*', True),
+    ('gzip;q=0', False),
+    ('gzip; q=0.000, deflate', False),
+    ('*;q=0', False),
+    ('*, gzip;q=0', False),
+    ('gzip;q=0, *', False),
+    ('gzip;q=bogus', False),
+    ('identity', False),
+    ('', False),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
@@ -0,0 +1,77 @@
+"""Tests for the data validation script."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+import validate_data  # noqa: E402
+from validate_data import DataValidator, count_messages  # noqa: E402
+
+
+def make_validator(data_dir):
+    validator = DataValidator()
+    validator.data_dir = data_dir
+    return validator
+
+
+def test_zero_spocs_with_untyped_email_column(tmp_path):
+    """A header-only spocs table whose email column has no type validates cleanly."""
+    pd.DataFrame({'client_id': [1], 'company_name': ['Acme']}).to_csv(tmp_path / 'clients.csv', index=False)
+
+    columns = ['spoc_id', 'client_id', 'full_name', 'email', 'job_title',
+               'linkedin_url', 'last_contact_date']
+    pd.DataFrame(columns=columns).to_csv(tmp_path / 'spocs.csv', index=False)
+    # Parquet twin as written for zero SPOCs before the email column was typed
+    empty = pa.table({name: pa.array([], type=pa.null()) for name in columns})
+    pd.DataFrame(empty.to_pandas(types_mapper=pd.ArrowDtype)).to_parquet(tmp_path / 'spocs.parquet')
+
+    validator = make_validator(tmp_path)
+    validator.validate_spocs_csv()
+
+    assert validator.errors == []
+    assert validator.warnings == []
+
+
+def test_numeric_email_column_counts_as_invalid(tmp_path):
+    """A float email column (blank emails in a CSV) is reported, not an error."""
+    pd.DataFrame({
+        'spoc_id': [1, 2], 'client_id': [1, 1], 'full_name': ['A', 'B'],
+        'email': [float('nan'), 1.0],
+        'job_title': '', 'linkedin_url': '', 'last_contact_date': '',
+    }).to_csv(tmp_path / 'spocs.csv', index=False)
+
+    validator = make_validator(tmp_path)
+    validator.validate_spocs_csv()
+
+    assert validator.errors == []
+    assert any('2 records with invalid email format' in w for w in validator.warnings)
+
+
+MBOX_MESSAGE = 'From sender Mon Jan  1 00:00:00 2024\nSubject: hi\n\n>From the desk of Ann\n\n'
+
+
+def test_count_messages_separator_across_blocks(tmp_path):
+    """A separator split across the 1 MB read boundary is counted once."""
+    first = MBOX_MESSAGE.encode()
+    # Second separator starts 3 bytes before the boundary: '\nFr' | 'om '
+    padding = b'x' * (validate_data.MBOX_BUFFER_SIZE - len(first) - 3)
+    mbox_path = tmp_path / 'big.mbox'
+    mbox_path.write_bytes(first + padding + b'\n' + MBOX_MESSAGE.encode())
+
+    assert count_messages(mbox_path) == 2
+
+
+@pytest.mark.parametrize('buffer_size', [2, 3, 5, 6, 7, 13])
+def test_count_messages_any_block_size(tmp_path, monkeypatch, buffer_size):
+    """Every split position gives the same count; quoted '>From ' body lines don't count."""
+    monkeypatch.setattr(validate_data, 'MBOX_BUFFER_SIZE', buffer_size)
+    mbox_path = tmp_path / 'small.mbox'
+    mbox_path.write_text(MBOX_MESSAGE * 3)
+
+    assert count_messages(mbox_path) == 3